@@ -0,0 +1,64 @@
+"""
+In-memory caching helpers
+Lets repeat submissions of the same label skip OCR and verification entirely
+"""
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+import hashlib
+
+# Number of OCR results kept in memory (least recently used are evicted first)
+OCR_CACHE_SIZE = 512
+
+# Number of verification results kept in memory
+VERIFICATION_CACHE_SIZE = 512
+
+
+def content_hash(data: bytes) -> str:
+    """
+    Fast content hash used as a cache key for uploaded files
+
+    Args:
+        data: Raw file bytes
+
+    Returns:
+        Hex digest of the content (BLAKE2b, 128-bit)
+    """
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class LRUCache:
+    """Fixed-size least-recently-used cache backed by an OrderedDict"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value (marking it most recently used) or None"""
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return None
+        return self._data[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached entries"""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# OCR results keyed by (content_hash(image_bytes), deep) -> (extracted_text, word_boxes)
+ocr_cache = LRUCache(OCR_CACHE_SIZE)
+
+# Verification results keyed by (content_hash(extracted_text), form fields...) -> VerificationResponse
+# (responses are frozen models, so a cached instance can be returned to every caller)
+verification_cache = LRUCache(VERIFICATION_CACHE_SIZE)
@@ -2,12 +2,26 @@
 TTB Label Verification API
 Main FastAPI application entry point
 """
+import os
+
+# Tesseract's OpenMP threading is slower than running one single-threaded OCR
+# per core, so cap it before the OCR libraries are loaded
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
 from fastapi import FastAPI, File, UploadFile, Form, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Optional
+import asyncio
 import logging
+import multiprocessing
 
-from app.ocr import extract_text_from_image, validate_image_quality, extract_text_with_boxes
+import PIL
+
+from app.ocr import validate_image_quality, extract_text_with_boxes, init_ocr_engine, MAX_FILE_SIZE
+from app.cache import content_hash, ocr_cache, verification_cache
 from app.verification import verify_label_data
 from app.models import VerificationResponse, BeverageType
 
@@ -19,7 +33,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="TTB Label Verification API",
     description="AI-powered alcohol label verification system",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -32,6 +47,127 @@ app.add_middleware(
 )
 
 
+# Uploads are read in chunks of this size so oversized files are rejected early
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Longest accepted brand name / product class; they are fuzzy-matched against
+# the OCR text, and alignment cost grows with the pattern length
+MAX_FORM_TEXT_LENGTH = 200
+
+# OCR worker processes, one per core; each loads its own Tesseract engine once
+ocr_pool: Optional[ProcessPoolExecutor] = None
+
+
+def start_ocr_pool() -> ProcessPoolExecutor:
+    """Create the OCR process pool (one worker per core, each initializing its own engine)"""
+    workers = os.cpu_count() or 1
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_ocr_engine
+    )
+    logger.info(f"OCR process pool started with {workers} workers")
+    return pool
+
+
+@app.on_event("startup")
+async def startup():
+    """Start the OCR process pool so concurrent requests OCR in parallel"""
+    global ocr_pool
+    ocr_pool = start_ocr_pool()
+    # Pillow-SIMD builds report a ".postN" version suffix
+    simd = ".post" in PIL.__version__
+    logger.info(f"Image library: Pillow {PIL.__version__}{' (SIMD build)' if simd else ''}")
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Stop the OCR process pool"""
+    if ocr_pool is not None:
+        ocr_pool.shutdown(cancel_futures=True)
+
+
+async def run_ocr(image_bytes: bytes, image: Optional["PIL.Image.Image"], deep: bool) -> tuple[str, dict]:
+    """
+    Run extract_text_with_boxes in the OCR process pool, off the event loop
+    
+    A worker that dies (tesseract crash, OOM kill) breaks the whole pool, so a
+    broken pool is replaced and the call retried once; otherwise every later
+    request would fail until the server restarts.
+    
+    Args:
+        image_bytes: Encoded upload, sent to worker processes (pickling a PIL
+            image would decode it just to ship raw pixels)
+        image: Opened image, used by the in-process fallback when there is no pool
+        deep: Always re-read the top of the label with PSM 11
+        
+    Returns:
+        (extracted_text, word_boxes)
+    """
+    global ocr_pool
+    
+    pool = ocr_pool
+    if pool is None:
+        return await asyncio.to_thread(extract_text_with_boxes, image, deep)
+    
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(pool, extract_text_with_boxes, image_bytes, deep)
+    except BrokenProcessPool:
+        logger.error("OCR worker process died; restarting the OCR process pool and retrying", exc_info=True)
+        # Concurrent requests see the same broken pool; only the first replaces it
+        if ocr_pool is pool:
+            ocr_pool = start_ocr_pool()
+            pool.shutdown(wait=False)
+    
+    return await loop.run_in_executor(ocr_pool, extract_text_with_boxes, image_bytes, deep)
+
+
+async def read_upload(upload: UploadFile, max_size: int = MAX_FILE_SIZE) -> bytearray:
+    """
+    Read an uploaded file in chunks, aborting once it exceeds max_size
+    
+    Args:
+        upload: Uploaded file
+        max_size: Maximum accepted size in bytes
+        
+    Returns:
+        File contents
+        
+    Raises:
+        HTTPException: 413 if the file is larger than max_size
+    """
+    buffer = bytearray()
+    while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+        buffer += chunk
+        if len(buffer) > max_size:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Image file too large. Maximum {max_size / 1024 / 1024}MB allowed."
+            )
+    return buffer
+
+
+def to_response(result: VerificationResponse, word_boxes: Optional[dict] = None) -> ORJSONResponse:
+    """
+    Serialize a verification result directly
+    
+    Returning a Response skips FastAPI's response_model round trip (dump,
+    re-validate, dump again); the models are built by our own code, so
+    re-validating them only costs time. response_model stays on the route
+    for the OpenAPI schema.
+    
+    Args:
+        result: Verification result to send
+        word_boxes: OCR word boxes (already in the BoundingBox shape), added to
+            the payload as-is instead of being converted to models and back
+    """
+    content = result.model_dump(mode='json')
+    if word_boxes is not None:
+        content['word_boxes'] = word_boxes
+    return ORJSONResponse(content=content)
+
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
@@ -44,12 +180,13 @@ async def root():
 
 @app.post("/api/verify", response_model=VerificationResponse)
 async def verify_label(
-    brand_name: str = Form(...),
-    product_class: str = Form(...),
+    brand_name: str = Form(..., max_length=MAX_FORM_TEXT_LENGTH),
+    product_class: str = Form(..., max_length=MAX_FORM_TEXT_LENGTH),
     alcohol_content: float = Form(...),
     net_contents: Optional[str] = Form(None),
     beverage_type: str = Form("spirits"),
-    label_image: UploadFile = File(...)
+    label_image: UploadFile = File(...),
+    deep: bool = False
 ):
     """
     Verify alcohol label against form data with beverage-type specific rules
@@ -61,6 +198,8 @@ async def verify_label(
         net_contents: Net contents/volume (optional)
         beverage_type: Type of beverage (spirits, wine, beer)
         label_image: Uploaded label image file
+        deep: Query flag to always re-read the top of the label with PSM 11 (otherwise
+            done only when few confident words were found there), for decorative brand names
     
     Returns:
         VerificationResponse with match results and details
@@ -75,37 +214,47 @@ async def verify_label(
                 detail="Uploaded file must be an image (JPEG, PNG, etc.)"
             )
         
-        # Read image file
-        image_bytes = await label_image.read()
-        
-        # Validate image quality before OCR
-        logger.info("Validating image quality...")
-        is_valid, validation_message = validate_image_quality(image_bytes)
+        # Read image file (rejects oversized uploads without buffering them fully)
+        image_bytes = await read_upload(label_image)
         
-        if not is_valid:
-            logger.warning(f"Image quality validation failed: {validation_message}")
-            return VerificationResponse(
-                success=False,
-                overall_match=False,
-                message=f"⚠️ Image quality check failed: {validation_message}",
-                extracted_text="",
-                checks=[]
-            )
+        # Serve repeat submissions of the same image from the OCR cache
+        # (hashlib releases the GIL, so hashing a large upload in a thread doesn't stall the event loop)
+        cache_key = (await asyncio.to_thread(content_hash, image_bytes), deep)
+        cached = ocr_cache.get(cache_key)
         
-        # Extract text from image using OCR with bounding boxes
-        logger.info("Extracting text from label image...")
-        extracted_text, word_boxes = extract_text_with_boxes(image_bytes)
+        if cached is not None:
+            logger.info("Using cached OCR result for previously submitted image")
+            extracted_text, word_boxes = cached
+        else:
+            # Validate image quality before OCR
+            logger.info("Validating image quality...")
+            is_valid, validation_message, image = await asyncio.to_thread(validate_image_quality, image_bytes)
+            
+            if not is_valid:
+                logger.warning(f"Image quality validation failed: {validation_message}")
+                return to_response(VerificationResponse(
+                    success=False,
+                    overall_match=False,
+                    message=f"⚠️ Image quality check failed: {validation_message}",
+                    extracted_text="",
+                    checks=[]
+                ))
+            
+            # Extract text from image using OCR with bounding boxes, off the event loop
+            logger.info("Extracting text from label image...")
+            extracted_text, word_boxes = await run_ocr(image_bytes, image, deep)
+            ocr_cache.put(cache_key, (extracted_text, word_boxes))
         
         if not extracted_text or len(extracted_text.strip()) < 10:
             logger.warning("Could not extract sufficient text from image")
-            return VerificationResponse(
+            return to_response(VerificationResponse(
                 success=False,
                 overall_match=False,
                 message="⚠️ Could not read text from the label image. Please try a clearer image.",
                 extracted_text=extracted_text,
                 checks=[],
                 word_boxes={}
-            )
+            ))
         
         logger.info(f"Extracted text length: {len(extracted_text)} characters")
         logger.info(f"OCR EXTRACTED TEXT:\n{extracted_text}\n")
@@ -117,22 +266,33 @@ async def verify_label(
             bev_type = BeverageType.SPIRITS  # Default to spirits
         
         # Verify extracted data against form inputs with beverage-specific rules
-        verification_result = verify_label_data(
-            extracted_text=extracted_text,
-            brand_name=brand_name,
-            product_class=product_class,
-            alcohol_content=alcohol_content,
-            net_contents=net_contents,
-            beverage_type=bev_type
+        # (an identical resubmission reuses the previous result)
+        verification_key = (
+            content_hash(extracted_text.encode()),
+            brand_name, product_class, alcohol_content, net_contents, bev_type
         )
-        
-        # Add word boxes to response for frontend highlighting
-        verification_result.word_boxes = word_boxes
+        verification_result = verification_cache.get(verification_key)
+        if verification_result is None:
+            # Runs in a worker thread so long OCR texts don't block the event loop
+            # (rapidfuzz releases the GIL while scoring)
+            verification_result = await asyncio.to_thread(
+                verify_label_data,
+                extracted_text=extracted_text,
+                brand_name=brand_name,
+                product_class=product_class,
+                alcohol_content=alcohol_content,
+                net_contents=net_contents,
+                beverage_type=bev_type
+            )
+            verification_cache.put(verification_key, verification_result)
         
         logger.info(f"Verification complete. Match: {verification_result.overall_match}")
         
-        return verification_result
+        # Add word boxes to response for frontend highlighting
+        return to_response(verification_result, word_boxes)
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error processing verification: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -1,8 +1,8 @@
 """
 Pydantic models for request/response validation
 """
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Optional, Dict
 from enum import Enum
 
 
@@ -15,6 +15,8 @@ class BeverageType(str, Enum):
 
 class BoundingBox(BaseModel):
     """Bounding box coordinates for highlighting"""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     left: int = Field(..., description="Left coordinate (x)")
     top: int = Field(..., description="Top coordinate (y)")
     width: int = Field(..., description="Width of bounding box")
@@ -24,6 +26,8 @@ class BoundingBox(BaseModel):
 
 class FieldCheck(BaseModel):
     """Individual field verification result"""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     field_name: str = Field(..., description="Name of the field being checked")
     expected_value: str = Field(..., description="Expected value from form")
     found_value: Optional[str] = Field(None, description="Value found in image")
@@ -35,9 +39,11 @@ class FieldCheck(BaseModel):
 
 class VerificationResponse(BaseModel):
     """Complete verification response"""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+    
     success: bool = Field(..., description="Whether the request was processed successfully")
     overall_match: bool = Field(..., description="Whether all required fields matched")
     message: str = Field(..., description="Overall result message")
     extracted_text: str = Field(..., description="Raw text extracted from image")
     checks: List[FieldCheck] = Field(..., description="Individual field verification results")
-    word_boxes: Optional[Dict[str, Any]] = Field(None, description="All word-level bounding boxes for highlighting")
+    word_boxes: Optional[Dict[str, List[BoundingBox]]] = Field(None, description="Word-level bounding boxes for highlighting, keyed by lowercase word")
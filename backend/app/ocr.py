@@ -2,10 +2,23 @@
 OCR (Optical Character Recognition) module
 Handles text extraction from label images using Tesseract
 """
+import cv2
+import numpy as np
 import pytesseract
-from PIL import Image, ImageEnhance, ImageFilter, ImageOps
+from PIL import Image
+import glob
 import io
 import logging
+import os
+import subprocess
+import threading
+from collections import defaultdict
+from typing import Iterator, Optional, Union
+
+try:
+    import tesserocr
+except ImportError:  # Optional native binding; the tesseract CLI is used without it
+    tesserocr = None
 
 logger = logging.getLogger(__name__)
 
@@ -15,219 +28,607 @@ MIN_HEIGHT = 400
 MIN_FILE_SIZE = 5000  # 5KB
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 
+# Longest edge fed to Tesseract; larger uploads are downscaled first
+# (OCR time grows with pixel count and accuracy does not improve past this)
+MAX_OCR_DIMENSION = 1600
+
+# Words at or below this Tesseract confidence are treated as noise
+MIN_WORD_CONFIDENCE = 30
+
+# The top of the label is re-read with PSM 11 when PSM 3 found fewer than
+# TOP_AREA_MIN_WORDS words above TOP_AREA_MIN_CONFIDENCE there
+TOP_AREA_MIN_WORDS = 3
+TOP_AREA_MIN_CONFIDENCE = 60
+
+# Label-region crop: the largest edge cluster (padded by LABEL_CROP_PADDING on
+# each side) is OCR'd instead of the whole photo, unless it covers less than
+# LABEL_CROP_MIN_AREA of the image (then it is probably noise)
+LABEL_CROP_PADDING = 0.05
+LABEL_CROP_MIN_AREA = 0.3
+_CROP_DILATE_KERNEL = cv2.getStructuringElement(cv2.MORPH_RECT, (20, 20))
+
+# Tesseract CLI arguments shared by every pass (the page segmentation mode is
+# appended per call); built once, and passed as a list so no shell parses them
+OCR_CONFIG = ('-l', 'eng', '--oem', '3')
+
+# System tessdata directories probed when TESSDATA_PREFIX is not set (Debian/Ubuntu
+# packages install under a per-version directory; the Aptfile buildpack unpacks the
+# same packages under /app/.apt). The tesserocr wheel bundles its own libtesseract
+# whose default data path is "./", so the path must be passed in
+TESSDATA_SEARCH_PATTERNS = (
+    '/usr/share/tesseract-ocr/*/tessdata',
+    '/app/.apt/usr/share/tesseract-ocr/*/tessdata',
+    '/usr/share/tessdata',
+    '/usr/local/share/tessdata',
+    '/opt/homebrew/share/tessdata',
+)
+
+# Contrast-limited adaptive histogram equalization, shared across calls
+_CLAHE = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+
+
+# Persistent Tesseract handle (tesserocr C-API); None means fall back to the tesseract CLI
+_ocr_api = None
+# A PyTessBaseAPI instance is not thread-safe, so every use goes through this lock
+_ocr_api_lock = threading.Lock()
+
+# Keys of pytesseract's image_to_data Output.DICT that the helpers below rely on
+_DATA_KEYS = (
+    'block_num', 'par_num', 'line_num', 'word_num',
+    'left', 'top', 'width', 'height', 'conf', 'text'
+)
+
+
+def find_tessdata_dir() -> Optional[str]:
+    """
+    Locate the tessdata directory for the persistent tesserocr handle
+    
+    TESSDATA_PREFIX wins when set; otherwise the first system directory
+    containing eng.traineddata is used (newest tesseract version first).
+    
+    Returns:
+        Path of the tessdata directory, or None if none was found
+    """
+    prefix = os.environ.get('TESSDATA_PREFIX')
+    if prefix:
+        return prefix
+    
+    for pattern in TESSDATA_SEARCH_PATTERNS:
+        for path in sorted(glob.glob(pattern), reverse=True):
+            if os.path.isfile(os.path.join(path, 'eng.traineddata')):
+                return path
+    return None
+
+
+def init_ocr_engine() -> bool:
+    """
+    Initialize the persistent tesserocr API handle
+    
+    Loading eng.traineddata once here avoids spawning a tesseract process and
+    reloading the model on every OCR call. Safe to call more than once.
+    
+    Returns:
+        True if the tesserocr backend is active, False if the tesseract CLI is used
+    """
+    global _ocr_api
+    
+    if _ocr_api is not None:
+        return True
+    
+    if tesserocr is None:
+        logger.warning("tesserocr not installed, falling back to the tesseract CLI (one process per OCR call)")
+        return False
+    
+    tessdata_dir = find_tessdata_dir()
+    try:
+        if tessdata_dir:
+            _ocr_api = tesserocr.PyTessBaseAPI(path=tessdata_dir, psm=tesserocr.PSM.AUTO, oem=tesserocr.OEM.DEFAULT)
+        else:
+            _ocr_api = tesserocr.PyTessBaseAPI(psm=tesserocr.PSM.AUTO, oem=tesserocr.OEM.DEFAULT)
+    except RuntimeError as e:
+        logger.error(
+            f"Could not initialize tesserocr (tessdata: {tessdata_dir or 'not found'}), falling back to "
+            f"the tesseract CLI (one process per OCR call); set TESSDATA_PREFIX to the directory "
+            f"containing eng.traineddata: {str(e)}"
+        )
+        return False
+    
+    logger.info(
+        f"tesserocr backend initialized ({tesserocr.tesseract_version().splitlines()[0]}, "
+        f"tessdata: {tessdata_dir or 'default'})"
+    )
+    return True
+
+
+def _tesserocr_set_image(image: Union[Image.Image, np.ndarray]) -> None:
+    """Hand an image to the persistent handle; 8-bit arrays are passed as raw bytes with no encode step"""
+    if isinstance(image, np.ndarray):
+        image = np.ascontiguousarray(image)
+        height, width = image.shape[:2]
+        bytes_per_pixel = 1 if image.ndim == 2 else image.shape[2]
+        _ocr_api.SetImageBytes(image.tobytes(), width, height, bytes_per_pixel, width * bytes_per_pixel)
+    else:
+        _ocr_api.SetImage(image)
+
+
+def _tesserocr_data(image: Union[Image.Image, np.ndarray], psm: int) -> dict:
+    """
+    Run the persistent tesserocr handle and return image_to_data-shaped output
+    
+    Caller must hold _ocr_api_lock.
+    """
+    data = {key: [] for key in _DATA_KEYS}
+    
+    _ocr_api.SetPageSegMode(psm)
+    _tesserocr_set_image(image)
+    _ocr_api.Recognize()
+    
+    iterator = _ocr_api.GetIterator()
+    if iterator is None:
+        return data
+    
+    level = tesserocr.RIL.WORD
+    block_num = par_num = line_num = word_num = 0
+    
+    for result in tesserocr.iterate_level(iterator, level):
+        # Reproduce the block/paragraph/line/word numbering of tesseract's TSV output
+        if result.IsAtBeginningOf(tesserocr.RIL.BLOCK):
+            block_num += 1
+            par_num = line_num = 0
+        if result.IsAtBeginningOf(tesserocr.RIL.PARA):
+            par_num += 1
+            line_num = 0
+        if result.IsAtBeginningOf(tesserocr.RIL.TEXTLINE):
+            line_num += 1
+            word_num = 0
+        word_num += 1
+        
+        bbox = result.BoundingBox(level)
+        if bbox is None:
+            continue
+        x1, y1, x2, y2 = bbox
+        
+        data['block_num'].append(block_num)
+        data['par_num'].append(par_num)
+        data['line_num'].append(line_num)
+        data['word_num'].append(word_num)
+        data['left'].append(x1)
+        data['top'].append(y1)
+        data['width'].append(x2 - x1)
+        data['height'].append(y2 - y1)
+        data['conf'].append(int(result.Confidence(level)))
+        data['text'].append(result.GetUTF8Text(level) or '')
+    
+    return data
+
 
-def validate_image_quality(image_bytes: bytes) -> tuple[bool, str]:
+def _to_pnm(image: Union[Image.Image, np.ndarray]) -> bytes:
+    """
+    Encode an image as binary PNM (PGM for grayscale, PPM for RGB)
+    
+    PNM is a short text header followed by the raw pixel bytes, so encoding is
+    essentially a memory copy, unlike the PNG round trip pytesseract performs.
+    """
+    if isinstance(image, Image.Image) and image.mode not in ('L', 'RGB'):
+        image = image.convert('RGB')
+    pixels = np.ascontiguousarray(image, dtype=np.uint8)
+    height, width = pixels.shape[:2]
+    magic = 'P5' if pixels.ndim == 2 else 'P6'
+    return f'{magic}\n{width} {height}\n255\n'.encode('ascii') + pixels.tobytes()
+
+
+def _run_tesseract(image: Union[Image.Image, np.ndarray], psm: int, tsv: bool = False) -> str:
+    """
+    Run the tesseract CLI on an image piped through stdin as PNM
+    
+    Avoids pytesseract's temp-file PNG encode and the CLI's PNG decode. The
+    command is passed as an argument list, so no shell is involved.
+    
+    Args:
+        image: Grayscale or RGB image
+        psm: Tesseract page segmentation mode
+        tsv: Return word-level TSV instead of plain text
+        
+    Returns:
+        Tesseract's stdout (plain text or TSV)
+    """
+    args = [pytesseract.pytesseract.tesseract_cmd, 'stdin', 'stdout', *OCR_CONFIG, '--psm', str(psm)]
+    if tsv:
+        args.append('tsv')
+    
+    try:
+        result = subprocess.run(args, input=_to_pnm(image), capture_output=True)
+    except FileNotFoundError:
+        raise pytesseract.TesseractNotFoundError()
+    
+    if result.returncode != 0:
+        raise pytesseract.TesseractError(result.returncode, result.stderr.decode('utf-8', 'replace').strip())
+    
+    return result.stdout.decode('utf-8')
+
+
+def _parse_tsv(tsv: str) -> dict:
+    """
+    Parse tesseract TSV output into the image_to_data Output.DICT shape
+    
+    Rows without recognized text (page/block/line records) have no text cell;
+    they get an empty string so every column stays the same length.
+    """
+    data = {key: [] for key in _DATA_KEYS}
+    lines = tsv.splitlines()
+    if not lines:
+        return data
+    
+    header = lines[0].split('\t')
+    columns = [(key, header.index(key)) for key in _DATA_KEYS if key != 'text']
+    text_column = header.index('text')
+    
+    for line in lines[1:]:
+        cells = line.split('\t')
+        if len(cells) < text_column:
+            continue
+        for key, column in columns:
+            data[key].append(int(float(cells[column])))
+        data['text'].append(cells[text_column] if len(cells) > text_column else '')
+    
+    return data
+
+
+def _image_to_data(image: Union[Image.Image, np.ndarray], psm: int = 3) -> dict:
+    """Word-level OCR data (pytesseract Output.DICT shape) from whichever backend is active"""
+    with _ocr_api_lock:
+        if _ocr_api is not None:
+            return _tesserocr_data(image, psm)
+    
+    return _parse_tsv(_run_tesseract(image, psm, tsv=True))
+
+
+def _image_to_string(image: Union[Image.Image, np.ndarray], psm: int = 3) -> str:
+    """Plain OCR text from whichever backend is active"""
+    with _ocr_api_lock:
+        if _ocr_api is not None:
+            _ocr_api.SetPageSegMode(psm)
+            _tesserocr_set_image(image)
+            return _ocr_api.GetUTF8Text()
+    
+    return _run_tesseract(image, psm)
+
+
+def validate_image_quality(image_bytes: bytes) -> tuple[bool, str, Optional[Image.Image]]:
     """
     Validate image quality before OCR processing
     
+    Only the image header is parsed (PIL opens lazily), so invalid images are
+    rejected without decoding any pixels.
+    
     Args:
         image_bytes: Image file as bytes
         
     Returns:
-        Tuple of (is_valid, error_message)
+        Tuple of (is_valid, error_message, image)
+        image is the opened (not yet decoded) PIL image when valid, else None;
+        it can be passed to extract_text_with_boxes to avoid re-opening the file
     """
     try:
         # Check file size
         file_size = len(image_bytes)
         if file_size < MIN_FILE_SIZE:
-            return False, f"Image file too small ({file_size} bytes). Minimum {MIN_FILE_SIZE} bytes required for quality OCR."
+            return False, f"Image file too small ({file_size} bytes). Minimum {MIN_FILE_SIZE} bytes required for quality OCR.", None
         
         if file_size > MAX_FILE_SIZE:
-            return False, f"Image file too large ({file_size / 1024 / 1024:.1f}MB). Maximum {MAX_FILE_SIZE / 1024 / 1024}MB allowed."
+            return False, f"Image file too large ({file_size / 1024 / 1024:.1f}MB). Maximum {MAX_FILE_SIZE / 1024 / 1024}MB allowed.", None
         
         # Open and check image dimensions
         image = Image.open(io.BytesIO(image_bytes))
         width, height = image.size
         
         if width < MIN_WIDTH or height < MIN_HEIGHT:
-            return False, f"Image resolution too low ({width}x{height}). Minimum {MIN_WIDTH}x{MIN_HEIGHT} pixels required for accurate OCR."
+            return False, f"Image resolution too low ({width}x{height}). Minimum {MIN_WIDTH}x{MIN_HEIGHT} pixels required for accurate OCR.", None
         
         # Check if image is too small in aspect ratio (likely a thumbnail or icon)
         if width < 200 or height < 200:
-            return False, "Image appears to be a thumbnail. Please upload a full-size label image."
+            return False, "Image appears to be a thumbnail. Please upload a full-size label image.", None
         
         # Check color mode
         if image.mode not in ('RGB', 'RGBA', 'L', 'P'):
-            return False, f"Unsupported image color mode '{image.mode}'. Please use RGB, RGBA, or grayscale images."
+            return False, f"Unsupported image color mode '{image.mode}'. Please use RGB, RGBA, or grayscale images.", None
         
         logger.info(f"Image quality validation passed: {width}x{height}, {file_size} bytes, mode: {image.mode}")
-        return True, "OK"
+        return True, "OK", image
         
     except Exception as e:
         logger.error(f"Error validating image quality: {str(e)}")
-        return False, f"Invalid image file: {str(e)}"
+        return False, f"Invalid image file: {str(e)}", None
 
 
-def extract_text_from_image(image_bytes: bytes) -> str:
+def _lines(text: str) -> Iterator[str]:
+    """Stripped, non-empty lines of OCR output (splitlines also handles CRLF line endings)"""
+    return (line for line in map(str.strip, text.splitlines()) if line)
+
+
+def _text_from_data(data: dict) -> str:
     """
-    Extract text from image using Tesseract OCR with enhanced preprocessing
-    Tries multiple strategies to handle decorative fonts and various label designs
+    Rebuild reading-order text from Tesseract's word-level output
+    
+    Words are grouped by (block_num, par_num, line_num) and ordered by word_num,
+    so a single image_to_data pass yields both the text and the bounding boxes.
     
     Args:
-        image_bytes: Image file as bytes
+        data: pytesseract.image_to_data output (Output.DICT)
         
     Returns:
-        Extracted text from the image
+        Extracted text, one OCR line per output line
     """
-    try:
-        # Open image from bytes
-        image = Image.open(io.BytesIO(image_bytes))
+    lines = {}
+    for i, word in enumerate(data['text']):
+        word = word.strip()
+        if not word or int(data['conf'][i]) <= MIN_WORD_CONFIDENCE:
+            continue
+        line_key = (data['block_num'][i], data['par_num'][i], data['line_num'][i])
+        lines.setdefault(line_key, []).append((data['word_num'][i], word))
+    
+    return '\n'.join(
+        ' '.join(word for _, word in sorted(words))
+        for _, words in sorted(lines.items())
+    )
+
+
+def _build_word_boxes(data: dict, scale: float = 1.0, offset: tuple[int, int] = (0, 0)) -> dict:
+    """
+    Build the word -> bounding box mapping used for frontend highlighting
+    
+    Args:
+        data: pytesseract.image_to_data output (Output.DICT)
+        scale: Factor the OCR image was resized by; boxes are mapped back
+            to the original image's pixel space
+        offset: (left, top) of the OCR'd crop within the resized image
         
-        # Convert to RGB if necessary (handles different image formats)
-        if image.mode != 'RGB':
-            image = image.convert('RGB')
+    Returns:
+        {word: [{'left': x, 'top': y, 'width': w, 'height': h, 'conf': confidence}, ...]}
+        Every word maps to the list of places it was found
+    """
+    # Strings are normalized with plain str methods (np.char is a slow per-element loop);
+    # the numeric filtering runs on arrays and yields the indices of words to keep
+    texts = [text.strip() for text in data['text']]
+    confs = np.asarray(data['conf'], dtype=float).astype(np.int32)
+    
+    # Only include words with good confidence and non-empty text
+    has_text = np.fromiter(map(bool, texts), dtype=bool, count=len(texts))
+    keep = np.flatnonzero((confs > MIN_WORD_CONFIDENCE) & has_text)
+    
+    lefts, tops, widths, heights = (
+        np.rint((np.asarray(data[key])[keep] + shift) / scale).astype(int).tolist()
+        for key, shift in (('left', offset[0]), ('top', offset[1]), ('width', 0), ('height', 0))
+    )
+    
+    word_boxes = defaultdict(list)
+    for i, left, top, width, height, conf in zip(keep.tolist(), lefts, tops, widths, heights, confs[keep].tolist()):
+        word_boxes[texts[i].lower()].append({'left': left, 'top': top, 'width': width, 'height': height, 'conf': conf})
+    
+    return dict(word_boxes)
+
+
+def _load_image(image: Union[bytes, Image.Image]) -> Image.Image:
+    """
+    Decode image bytes (if needed) into the RGB image the OCR pipeline works on
+    
+    Args:
+        image: Image file as bytes, or an already opened PIL image
         
-        all_text_lines = set()  # Use set to avoid duplicates
-        width, height = image.size
+    Returns:
+        RGB PIL image
+    """
+    if isinstance(image, (bytes, bytearray)):
+        image = Image.open(io.BytesIO(image))
+    
+    # Convert to RGB if necessary (handles different image formats)
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+    
+    return image
+
+
+def _downscale(image: Image.Image) -> tuple[Image.Image, float]:
+    """
+    Shrink images whose longest edge exceeds MAX_OCR_DIMENSION
+    
+    The image is resized in place with Image.thumbnail, which avoids a second
+    full-size buffer and, for JPEGs not yet decoded, lets the decoder skip
+    straight to a reduced size (draft mode) before the LANCZOS pass.
+    
+    Args:
+        image: RGB label image (modified in place when downscaled)
         
-        # Strategy 1: Standard OCR with PSM 3 (fully automatic)
-        custom_config = r'--oem 3 --psm 3'
-        text1 = pytesseract.image_to_string(image, config=custom_config)
-        all_text_lines.update(line.strip() for line in text1.split('\n') if line.strip())
-        
-        # Strategy 2: Try PSM 4 (single column of text) - good for vertically stacked text
-        text2 = pytesseract.image_to_string(image, config=r'--oem 3 --psm 4')
-        all_text_lines.update(line.strip() for line in text2.split('\n') if line.strip())
-        
-        # Strategy 3: Enhanced contrast (helps with low-contrast decorative text)
-        enhancer = ImageEnhance.Contrast(image)
-        enhanced = enhancer.enhance(2.5)
-        text3 = pytesseract.image_to_string(enhanced, config=custom_config)
-        all_text_lines.update(line.strip() for line in text3.split('\n') if line.strip())
-        
-        # Strategy 4: Sharpening (helps with slightly blurry decorative fonts)
-        sharpened = image.filter(ImageFilter.SHARPEN)
-        text4 = pytesseract.image_to_string(sharpened, config=custom_config)
-        all_text_lines.update(line.strip() for line in text4.split('\n') if line.strip())
-        
-        # Strategy 5: Scale up 1.5x (helps with small text or low resolution)
-        scaled = image.resize((int(width * 1.5), int(height * 1.5)), Image.Resampling.LANCZOS)
-        text5 = pytesseract.image_to_string(scaled, config=custom_config)
-        all_text_lines.update(line.strip() for line in text5.split('\n') if line.strip())
-        
-        # Strategy 6: CRITICAL - Crop top 40% and use PSM 6 (uniform block)
-        # This catches large decorative brand names that PSM 3 misses
-        top_area = image.crop((int(width * 0.05), int(height * 0.1), int(width * 0.95), int(height * 0.4)))
-        text6 = pytesseract.image_to_string(top_area, config=r'--oem 3 --psm 6')
-        top_lines = [line.strip() for line in text6.split('\n') if line.strip() and len(line.strip()) > 2]
-        if top_lines:
-            logger.info(f"Top area OCR (PSM 6) found: {top_lines}")
-            all_text_lines.update(top_lines)
-        
-        # Strategy 7: Try PSM 11 on top area (sparse text with OSD)
-        # Sometimes works better with decorative fonts spread out
-        text7a = pytesseract.image_to_string(top_area, config=r'--oem 3 --psm 11')
-        psm11_lines = [line.strip() for line in text7a.split('\n') if line.strip() and len(line.strip()) > 2]
-        if psm11_lines:
-            logger.info(f"Top area OCR (PSM 11) found: {psm11_lines}")
-            all_text_lines.update(psm11_lines)
-        
-        # Strategy 8: Binary threshold on top area (high contrast for decorative text)
-        gray_top = top_area.convert('L')
-        binary_top = gray_top.point(lambda x: 0 if x < 180 else 255, '1')
-        text8 = pytesseract.image_to_string(binary_top, config=r'--oem 3 --psm 6')
-        binary_lines = [line.strip() for line in text8.split('\n') if line.strip() and len(line.strip()) > 2]
-        if binary_lines:
-            logger.info(f"Binary threshold OCR found: {binary_lines}")
-            all_text_lines.update(binary_lines)
-        
-        # Strategy 9: Inverted contrast on top area (alternative for decorative text)
-        inverted_top = ImageOps.invert(gray_top)
-        contrast_inv = ImageEnhance.Contrast(inverted_top).enhance(3.0)
-        text9 = pytesseract.image_to_string(contrast_inv, config=r'--oem 3 --psm 6')
-        inv_lines = [line.strip() for line in text9.split('\n') if line.strip() and len(line.strip()) > 2]
-        if inv_lines:
-            logger.info(f"Inverted top area OCR found: {inv_lines}")
-            all_text_lines.update(inv_lines)
-        
-        # Build combined text preserving logical order
-        # Standard OCR (text1) gives us the baseline order
-        base_lines = [line.strip() for line in text1.split('\n') if line.strip()]
-        
-        # Add any new lines found by other strategies at the top
-        # (assumes brand name is at top and most likely to be missed)
-        new_lines = all_text_lines - set(base_lines)
-        
-        if new_lines:
-            logger.info(f"Enhanced OCR found {len(new_lines)} additional lines: {list(new_lines)[:5]}")
-            # Sort new lines to put longer ones first (likely to be brand names)
-            sorted_new = sorted(new_lines, key=len, reverse=True)
-            combined = '\n'.join(sorted_new) + '\n' + '\n'.join(base_lines)
-        else:
-            combined = '\n'.join(base_lines)
+    Returns:
+        Tuple of (image to OCR, scale factor applied to the original)
+    """
+    width, height = image.size
+    longest = max(width, height)
+    if longest <= MAX_OCR_DIMENSION:
+        return image, 1.0
+    
+    image.thumbnail((MAX_OCR_DIMENSION, MAX_OCR_DIMENSION), Image.Resampling.LANCZOS)
+    logger.info(f"Downscaled {width}x{height} image to {image.size[0]}x{image.size[1]} for OCR")
+    return image, max(image.size) / longest
+
+
+def _to_grayscale(image: Image.Image) -> np.ndarray:
+    """Convert an RGB label image to a single-channel uint8 array for OCR"""
+    return cv2.cvtColor(np.asarray(image), cv2.COLOR_RGB2GRAY)
+
+
+def _binarize(gray: np.ndarray) -> np.ndarray:
+    """
+    CLAHE + Otsu binarization for low-contrast decorative text
+    
+    CLAHE evens out non-uniform lighting and Otsu picks the threshold
+    automatically, replacing the separate contrast/threshold/invert variants.
+    It hurts blurry or heavily compressed photos, so the main OCR pass
+    reads the plain grayscale image instead.
+    
+    Args:
+        gray: Single-channel uint8 image
         
-        logger.info(f"OCR extracted {len(combined)} characters using 9 preprocessing strategies")
-        logger.info(f"Total unique lines found: {len(all_text_lines)}")
+    Returns:
+        Binarized uint8 image (0 or 255)
+    """
+    equalized = _CLAHE.apply(gray)
+    _, binary = cv2.threshold(equalized, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    return binary
+
+
+def _crop_to_label(gray: np.ndarray) -> tuple[np.ndarray, tuple[int, int]]:
+    """
+    Crop a photo to its text-bearing region before OCR
+    
+    Bottle glass, table and background are cut away with a cheap edge pass
+    (Canny, dilated so nearby characters merge, largest contour). Tesseract's
+    run time grows with pixel area, so full-bottle photos OCR much faster.
+    
+    Args:
+        gray: Grayscale label image
         
-        return combined.strip()
+    Returns:
+        Tuple of (image to OCR, (left, top) offset of the crop); the full
+        image and (0, 0) when no convincing label region is found
+    """
+    height, width = gray.shape
+    edges = cv2.dilate(cv2.Canny(gray, 50, 150), _CROP_DILATE_KERNEL)
+    contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    if not contours:
+        return gray, (0, 0)
+    
+    x, y, w, h = cv2.boundingRect(max(contours, key=cv2.contourArea))
+    if w * h < LABEL_CROP_MIN_AREA * width * height:
+        return gray, (0, 0)
+    
+    pad_x, pad_y = int(w * LABEL_CROP_PADDING), int(h * LABEL_CROP_PADDING)
+    left, top = max(x - pad_x, 0), max(y - pad_y, 0)
+    right, bottom = min(x + w + pad_x, width), min(y + h + pad_y, height)
+    if (right - left) * (bottom - top) == width * height:
+        return gray, (0, 0)
+    
+    logger.info(f"Cropped {width}x{height} image to label region {right - left}x{bottom - top} at ({left}, {top})")
+    return gray[top:bottom, left:right], (left, top)
+
+
+def _top_area_bounds(height: int, width: int) -> tuple[int, int, int, int]:
+    """(top, bottom, left, right) of the region where brand names usually sit"""
+    return int(height * 0.1), int(height * 0.4), int(width * 0.05), int(width * 0.95)
+
+
+def _needs_top_pass(data: dict, height: int, width: int) -> bool:
+    """
+    Decide from the PSM 3 results whether the top area should be re-read
+    
+    Args:
+        data: pytesseract.image_to_data output (Output.DICT) for the full image
+        height: Height of the OCR'd image
+        width: Width of the OCR'd image
         
-    except Exception as e:
-        logger.error(f"Error extracting text from image: {str(e)}")
-        raise Exception(f"OCR processing failed: {str(e)}")
+    Returns:
+        True if PSM 3 found fewer than TOP_AREA_MIN_WORDS confident words in the top area
+    """
+    top, bottom, left, right = _top_area_bounds(height, width)
+    confident_words = 0
+    
+    for i, word in enumerate(data['text']):
+        if (word.strip()
+                and int(data['conf'][i]) > TOP_AREA_MIN_CONFIDENCE
+                and top <= data['top'][i] < bottom
+                and left <= data['left'][i] < right):
+            confident_words += 1
+            if confident_words >= TOP_AREA_MIN_WORDS:
+                return False
+    
+    return True
 
 
-def extract_text_with_boxes(image_bytes: bytes) -> tuple[str, dict]:
+def _top_area_lines(gray: np.ndarray) -> set[str]:
+    """
+    Re-read the top of the label with PSM 11 (sparse text)
+    
+    Large decorative brand names are the text PSM 3 most often misses; the
+    region is binarized and read as sparse text, which copes with
+    spread-out decorative fonts.
+    
+    Args:
+        gray: Grayscale label image
+        
+    Returns:
+        Set of stripped text lines (longer than 2 characters) found in the top area
+    """
+    top, bottom, left, right = _top_area_bounds(*gray.shape)
+    top_area = _binarize(gray[top:bottom, left:right])
+    
+    text = _image_to_string(top_area, psm=11)
+    lines = {line for line in _lines(text) if len(line) > 2}
+    if lines:
+        logger.info(f"Top area OCR (PSM 11) found: {sorted(lines)}")
+    
+    return lines
+
+
+def extract_text_from_image(image: Union[bytes, Image.Image], deep: bool = False) -> str:
+    """
+    Extract text from image using Tesseract OCR
+    
+    Args:
+        image: Image file as bytes, or an already opened PIL image
+        deep: Always re-read the top of the label for decorative brand names
+        
+    Returns:
+        Extracted text from the image
+    """
+    extracted_text, _ = extract_text_with_boxes(image, deep=deep)
+    return extracted_text
+
+
+def extract_text_with_boxes(image: Union[bytes, Image.Image], deep: bool = False) -> tuple[str, dict]:
     """
     Extract text from image with bounding box coordinates for highlighting
-    Uses enhanced multi-strategy OCR for better text extraction
+    
+    The image is decoded once and the same grayscale array is reused by every
+    OCR pass. Oversized images are downscaled first and background around the
+    label is cropped away; word boxes are reported in the original image's
+    coordinates. Tesseract is invoked once
+    (image_to_data, PSM 3) and both the text and the word boxes are derived
+    from that single pass. If that pass found little confident text in the top
+    area (or deep=True), the top of the label is binarized (CLAHE + Otsu) and
+    re-read with PSM 11; any new lines are prepended to the text.
     
     Args:
-        image_bytes: Image file as bytes
+        image: Image file as bytes, or an already opened PIL image
+        deep: Always re-read the top of the label for decorative brand names
         
     Returns:
         Tuple of (extracted_text, word_boxes_dict)
-        word_boxes_dict: {word: {'left': x, 'top': y, 'width': w, 'height': h, 'conf': confidence}}
+        word_boxes_dict: {word: [{'left': x, 'top': y, 'width': w, 'height': h, 'conf': confidence}, ...]}
     """
     try:
-        # Use the enhanced multi-strategy OCR for text extraction
-        enhanced_text = extract_text_from_image(image_bytes)
+        image, scale = _downscale(_load_image(image))
+        gray, offset = _crop_to_label(_to_grayscale(image))
         
-        # Still need to get bounding boxes from standard OCR
-        # (bounding boxes require image_to_data which is only available with standard OCR)
-        image = Image.open(io.BytesIO(image_bytes))
+        # Single Tesseract pass: word-level data with bounding boxes
+        data = _image_to_data(gray)
         
-        # Convert to RGB if necessary
-        if image.mode != 'RGB':
-            image = image.convert('RGB')
+        base_text = _text_from_data(data)
+        word_boxes = _build_word_boxes(data, scale, offset)
         
-        # Get detailed word-level data with bounding boxes using standard OCR
-        custom_config = r'--oem 3 --psm 3'
-        data = pytesseract.image_to_data(image, config=custom_config, output_type=pytesseract.Output.DICT)
+        if deep or _needs_top_pass(data, *gray.shape):
+            # Add any new lines found in the top area at the top
+            # (assumes brand name is at top and most likely to be missed)
+            new_lines = _top_area_lines(gray).difference(_lines(base_text))
+            
+            if new_lines:
+                logger.info(f"Top area OCR found {len(new_lines)} additional lines: {list(new_lines)[:5]}")
+                # Sort new lines to put longer ones first (likely to be brand names)
+                sorted_new = sorted(new_lines, key=len, reverse=True)
+                base_text = '\n'.join(sorted_new) + '\n' + base_text
         
-        # Build word boxes dictionary
-        word_boxes = {}
-        n_boxes = len(data['text'])
+        logger.info(f"OCR extracted {len(base_text)} characters with {len(word_boxes)} bounding boxes")
         
-        for i in range(n_boxes):
-            word_text = data['text'][i].strip()
-            conf = int(data['conf'][i])
-            
-            # Only include words with good confidence (> 30) and non-empty text
-            if word_text and conf > 30:
-                # Store bounding box info for each word
-                box_info = {
-                    'left': data['left'][i],
-                    'top': data['top'][i],
-                    'width': data['width'][i],
-                    'height': data['height'][i],
-                    'conf': conf
-                }
-                
-                word_lower = word_text.lower()
-                if word_lower in word_boxes:
-                    # Word already exists, store multiple occurrences
-                    if isinstance(word_boxes[word_lower], list):
-                        word_boxes[word_lower].append(box_info)
-                    else:
-                        # Convert to list
-                        word_boxes[word_lower] = [word_boxes[word_lower], box_info]
-                else:
-                    word_boxes[word_lower] = box_info
-        
-        logger.info(f"Enhanced OCR extracted {len(enhanced_text)} characters with {len(word_boxes)} bounding boxes")
-        
-        # Return enhanced text with bounding boxes from standard OCR
-        return enhanced_text.strip(), word_boxes
+        return base_text.strip(), word_boxes
         
     except Exception as e:
         logger.error(f"Error extracting text with boxes: {str(e)}")
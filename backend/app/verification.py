@@ -53,8 +53,9 @@ OCR CONFIGURATION:
 """
 import re
 import logging
+from functools import lru_cache
 from typing import Optional
-from Levenshtein import ratio
+from rapidfuzz import fuzz, process
 
 from app.models import VerificationResponse, FieldCheck, BeverageType
 
@@ -69,6 +70,61 @@ GOVT_WARNING_KEYWORDS = [
     "operating machinery"
 ]
 
+# Key phrases of the required warning, mapped to the description used in violations
+REQUIRED_WARNING_PHRASES = {
+    "women should not drink": "women and pregnancy warning",
+    "birth defects": "birth defects warning",
+    "drive a car or operate machinery": "driving/machinery warning",
+    "health problems": "health problems warning"
+}
+
+# Warning section from the "GOVERNMENT WARNING:" header to the end of the statutory text
+_GOVT_WARNING_RE = re.compile(r'GOVERNMENT WARNING:.*?(?:health problems|$)', re.IGNORECASE | re.DOTALL)
+
+# 4-digit vintage years between 1900-2099
+_VINTAGE_RE = re.compile(r'\b(19\d{2}|20\d{2})\b')
+
+# First number in a form value such as "750" or "750 mL"
+_FORM_NUMBER_RE = re.compile(r'(\d+(?:\.\d+)?)')
+
+# Net contents and alcohol content are read in one pass over the text.
+# Groups 2-5 are volume units in priority order (mL, L, oz, fl oz; the number
+# is group 1) and groups 6-9 are alcohol forms in priority order ("45%",
+# "45 percent", "alc. 45", "alcohol 45"), so match.lastindex is the rank of a
+# match and the first match of the best rank wins for each field.
+# The alc/alcohol forms capture the number in a lookahead so it stays available
+# to the "%" form (e.g. "Alcohol 45% by volume")
+_NUMERIC_RE = re.compile(
+    r'(\d+(?:\.\d+)?)\s*(?:(milliliters?|ml)|(liters?|l)|(ounces?|oz)|(fl\.?\s*oz))'
+    r'|(\d+\.?\d*)\s*%'
+    r'|(\d+\.?\d*)\s*percent'
+    r'|alc\.?\s*(?=(\d+\.?\d*))'
+    r'|alcohol\s*(?=(\d+\.?\d*))',
+    re.IGNORECASE
+)
+_VOLUME_ML = 2        # best volume rank
+_VOLUME_LAST = 5      # ranks above this are alcohol forms
+_PERCENT_SIGN = 6     # best alcohol rank
+
+
+# Fuzzy matching only looks at this many characters of the OCR text. Brand and
+# product names sit near the top of a label, and this bounds the cost of the
+# alignment on pathological OCR output (regex and exact checks see the full text)
+MAX_FUZZY_TEXT_LENGTH = 8192
+
+# A line's content from its first to its last non-space character, when that
+# spans at least two characters
+_BRAND_LINE_RE = re.compile(r'^[^\S\n]*(\S[^\n]*\S)', re.MULTILINE)
+
+# Common alcohol product types, longest (most specific) first; the sort is
+# stable, so equal-length types keep this listing order
+_PRODUCT_TYPES = sorted([
+    'bourbon whiskey', 'bourbon', 'whiskey', 'whisky',
+    'vodka', 'rum', 'gin', 'tequila', 'brandy',
+    'scotch', 'rye', 'cognac', 'beer', 'wine',
+    'kentucky straight bourbon whiskey'
+], key=len, reverse=True)
+
 # Official TTB required warning text (27 CFR 16.21)
 REQUIRED_WARNING_TEXT = """GOVERNMENT WARNING: (1) According to the Surgeon General, women should not drink alcoholic beverages during pregnancy because of the risk of birth defects. (2) Consumption of alcoholic beverages impairs your ability to drive a car or operate machinery, and may cause health problems."""
 
@@ -84,13 +140,12 @@ def extract_government_warning(text: str) -> Optional[str]:
         Extracted warning text or None
     """
     # Look for text starting with "GOVERNMENT WARNING"
-    pattern = r'GOVERNMENT WARNING:.*?(?:health problems|$)'
-    match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+    match = _GOVT_WARNING_RE.search(text)
     
     if match:
         warning_text = match.group(0)
         # Clean up extra whitespace but preserve structure
-        warning_text = re.sub(r'\s+', ' ', warning_text).strip()
+        warning_text = ' '.join(warning_text.split())
         return warning_text
     
     return None
@@ -121,13 +176,17 @@ def validate_warning_compliance(extracted_text: str) -> tuple[bool, list[str]]:
         violations.append("Government warning statement not found")
         return False, violations
     
+    # extract_government_warning already collapsed whitespace, so this is also
+    # the normalized form used for the similarity check below
+    warning_lower = warning_text.lower()
+    
     # Check 1: "GOVERNMENT WARNING" must be in all caps
     if "GOVERNMENT WARNING:" not in warning_text:
-        if "government warning:" in warning_text.lower():
+        if "government warning:" in warning_lower:
             violations.append("'GOVERNMENT WARNING' must be in all capital letters")
     
     # Check 2: "Surgeon General" capitalization (not "surgeon general" or "Surgeon general")
-    if "surgeon general" in warning_text.lower():
+    if "surgeon general" in warning_lower:
         # Check if it's properly capitalized
         if "Surgeon General" not in warning_text:
             violations.append("'Surgeon General' must have capital S and capital G")
@@ -141,25 +200,19 @@ def validate_warning_compliance(extracted_text: str) -> tuple[bool, list[str]]:
     if not has_statement_2:
         violations.append("Statement (2) about driving/machinery is missing")
     
-    # Check 4: Key phrases must be present
-    required_phrases = [
-        ("women should not drink", "women and pregnancy warning"),
-        ("birth defects", "birth defects warning"),
-        ("drive a car or operate machinery", "driving/machinery warning"),
-        ("health problems", "health problems warning")
-    ]
-    
-    warning_lower = warning_text.lower()
-    for phrase, description in required_phrases:
+    # Check 4: Key phrases must be present verbatim (this is regulatory text,
+    # so altered wording is a violation even when it is textually close)
+    for phrase, description in REQUIRED_WARNING_PHRASES.items():
         if phrase not in warning_lower:
             violations.append(f"Missing required phrase: '{description}'")
     
     # Check 5: Overall similarity to required text (fuzzy match for OCR tolerance)
-    # Normalize both texts for comparison
-    normalized_required = normalize_text(REQUIRED_WARNING_TEXT)
-    normalized_found = normalize_text(warning_text)
-    
-    similarity = ratio(normalized_required, normalized_found)
+    # Both texts are compared in normalized form; a verbatim warning (the usual
+    # case for a cleanly read label) needs no edit-distance scoring
+    if warning_lower == _REQUIRED_WARNING_NORM:
+        similarity = 1.0
+    else:
+        similarity = fuzz.ratio(_REQUIRED_WARNING_NORM, warning_lower) / 100
     
     # Require high similarity (0.90) since this is regulatory text
     if similarity < 0.90:
@@ -170,6 +223,34 @@ def validate_warning_compliance(extracted_text: str) -> tuple[bool, list[str]]:
     return is_compliant, violations
 
 
+def extract_abv_and_volume(text: str) -> tuple[Optional[float], Optional[str]]:
+    """
+    Extract alcohol percentage and volume/net contents in a single scan
+    
+    Args:
+        text: Text containing alcohol content and/or volume information
+        
+    Returns:
+        Tuple of (percentage or None, volume string or None)
+    """
+    best_abv = best_volume = None
+    for match in _NUMERIC_RE.finditer(text):
+        rank = match.lastindex
+        if rank <= _VOLUME_LAST:
+            if best_volume is None or rank < best_volume.lastindex:
+                best_volume = match
+        elif best_abv is None or rank < best_abv.lastindex:
+            best_abv = match
+        
+        # Nothing later in the text can beat a "%" value and a mL volume
+        if best_abv and best_volume and best_abv.lastindex == _PERCENT_SIGN and best_volume.lastindex == _VOLUME_ML:
+            break
+    
+    abv = float(best_abv.group(best_abv.lastindex)) if best_abv else None
+    volume = best_volume.group(1) if best_volume else None
+    return abv, volume
+
+
 def extract_volume(text: str) -> Optional[str]:
     """
     Extract volume/net contents from text
@@ -180,25 +261,92 @@ def extract_volume(text: str) -> Optional[str]:
     Returns:
         Extracted volume string or None
     """
-    # Look for patterns like "750 mL", "750mL", "12 oz", "1 liter", etc.
-    patterns = [
-        r'(\d+(?:\.\d+)?)\s*(?:ml|mL|ML|milliliters?)',
-        r'(\d+(?:\.\d+)?)\s*(?:l|L|liters?)',
-        r'(\d+(?:\.\d+)?)\s*(?:oz|ounces?)',
-        r'(\d+(?:\.\d+)?)\s*(?:fl\.?\s*oz)',
-    ]
-    
-    for pattern in patterns:
-        matches = re.findall(pattern, text.lower())
-        if matches:
-            return matches[0]  # Return first match
-    
-    return None
+    # Looks for patterns like "750 mL", "750mL", "12 oz", "1 liter", etc.
+    return extract_abv_and_volume(text)[1]
 
 
 def normalize_text(text: str) -> str:
     """Normalize text for comparison (lowercase, remove extra spaces)"""
-    return re.sub(r'\s+', ' ', text.lower().strip())
+    # str.split() collapses whitespace runs and trims the ends in one C pass
+    return ' '.join(text.lower().split())
+
+
+@lru_cache(maxsize=1024)
+def _normalize_pattern(pattern: str) -> str:
+    """
+    normalize_text for short strings that repeat across requests (form values)
+    
+    OCR text is unique per request and can be large, so it goes through
+    normalize_text directly and is never cached.
+    """
+    return normalize_text(pattern)
+
+
+# Regulatory warning text in normalized form, computed once at import
+_REQUIRED_WARNING_NORM = normalize_text(REQUIRED_WARNING_TEXT)
+
+
+def _word_span(text: str, start: int, end: int) -> str:
+    """Widen text[start:end] to whole words so partial matches read naturally"""
+    start = text.rfind(' ', 0, start + 1) + 1
+    end = text.find(' ', max(end - 1, start))
+    return text[start:] if end == -1 else text[start:end]
+
+
+def _prepare_text(text: str) -> tuple[str, str]:
+    """
+    Whitespace-collapsed text and its lowercase form, with matching offsets
+    
+    Offsets into the lowercase form are used to slice the original casing;
+    if lowercasing changes the length (rare Unicode cases) both are lowercase.
+    """
+    spaced = ' '.join(text.split())
+    text_norm = spaced.lower()
+    if len(text_norm) != len(spaced):
+        spaced = text_norm
+    return spaced, text_norm
+
+
+def _fuzzy_match_prepared(spaced: str, text_norm: str, pattern: str, threshold: float) -> tuple[bool, Optional[str]]:
+    """fuzzy_match against text already run through _prepare_text"""
+    pattern_norm = _normalize_pattern(pattern)
+    
+    # Exact substring match (a single C-level scan) before any fuzzy scoring
+    idx = text_norm.find(pattern_norm)
+    if idx != -1:
+        # Return the original case version of the text that matched
+        return True, spaced[idx:idx + len(pattern_norm)]
+    
+    # Fuzzy match: best-aligned substring of the text, scored with the
+    # Levenshtein-based ratio (rapidfuzz's C sliding window; score_cutoff lets
+    # it stop early on windows that cannot reach the threshold)
+    spaced, text_norm = spaced[:MAX_FUZZY_TEXT_LENGTH], text_norm[:MAX_FUZZY_TEXT_LENGTH]
+    cutoff = threshold * 100
+    alignment = fuzz.partial_ratio_alignment(pattern_norm, text_norm, score_cutoff=cutoff)
+    if alignment is not None:
+        return True, _word_span(spaced, alignment.dest_start, alignment.dest_end)
+    
+    # Try matching all words individually if no consecutive match found
+    # This handles cases where brand name words appear but are separated
+    # (e.g., "FANCY" and "VODKA" on different lines but OCR misses one)
+    pattern_words = pattern_norm.split()
+    if len(pattern_words) > 1:
+        # Each distinct word is scored once (labels repeat words a lot)
+        words = list(dict.fromkeys(text_norm.split()))
+        found_parts = []
+        
+        for pattern_word in pattern_words:
+            # Check if this word appears anywhere in the text
+            best = process.extractOne(pattern_word, words, scorer=fuzz.ratio, score_cutoff=cutoff)
+            if best is not None:
+                found_parts.append(best[0])
+        
+        # If we found most of the pattern words (at least 50% or threshold percentage)
+        word_match_ratio = len(found_parts) / len(pattern_words)
+        if word_match_ratio >= min(0.5, threshold):
+            return True, ' '.join(found_parts)
+    
+    return False, None
 
 
 def fuzzy_match(text: str, pattern: str, threshold: float = 0.8) -> tuple[bool, Optional[str]]:
@@ -214,59 +362,32 @@ def fuzzy_match(text: str, pattern: str, threshold: float = 0.8) -> tuple[bool,
         Tuple of (matched: bool, found_text: Optional[str])
         If matched, found_text contains the actual text that matched
     """
-    text_norm = normalize_text(text)
-    pattern_norm = normalize_text(pattern)
-    
-    # Exact substring match
-    if pattern_norm in text_norm:
-        # Find the actual text that matched
-        idx = text_norm.index(pattern_norm)
-        # Return the original case version
-        return True, text[idx:idx + len(pattern)]
-    
-    # Fuzzy match using Levenshtein distance
-    # Check if pattern appears as a substring with fuzzy matching
-    words = text_norm.split()
-    pattern_words = pattern_norm.split()
-    
-    # Try to find consecutive words that match the pattern
-    best_match = None
-    best_similarity = 0.0
+    return _fuzzy_match_prepared(*_prepare_text(text), pattern, threshold)
+
+
+def fuzzy_match_many(
+    text: str,
+    patterns: list[str],
+    threshold: float = 0.8,
+    prepared: Optional[tuple[str, str]] = None
+) -> list[tuple[bool, Optional[str]]]:
+    """
+    Fuzzy match several patterns against the same text
     
-    for i in range(len(words) - len(pattern_words) + 1):
-        window = ' '.join(words[i:i + len(pattern_words)])
-        similarity = ratio(window, pattern_norm)
-        if similarity >= threshold and similarity > best_similarity:
-            best_similarity = similarity
-            # Find the original text for this window
-            original_words = text.split()
-            best_match = ' '.join(original_words[i:i + len(pattern_words)])
+    The text is normalized once and shared by every pattern, instead of
+    once per fuzzy_match call.
     
-    # NEW: Try matching all words individually if no consecutive match found
-    # This handles cases where brand name words appear but are separated
-    # (e.g., "FANCY" and "VODKA" on different lines but OCR misses one)
-    if not best_match and len(pattern_words) > 1:
-        pattern_words_found = 0
-        found_parts = []
-        
-        for pattern_word in pattern_words:
-            # Check if this word appears anywhere in the text
-            for text_word in words:
-                if ratio(text_word, pattern_word) >= threshold:
-                    pattern_words_found += 1
-                    found_parts.append(text_word)
-                    break
+    Args:
+        text: Text to search in
+        patterns: Patterns to search for
+        threshold: Similarity threshold (0.0 to 1.0)
+        prepared: _prepare_text(text), if the caller already computed it
         
-        # If we found most of the pattern words (at least 50% or threshold percentage)
-        word_match_ratio = pattern_words_found / len(pattern_words)
-        if word_match_ratio >= min(0.5, threshold):
-            best_match = ' '.join(found_parts)
-            best_similarity = word_match_ratio
-    
-    if best_match:
-        return True, best_match
-    
-    return False, None
+    Returns:
+        One (matched, found_text) tuple per pattern, in order
+    """
+    spaced, text_norm = prepared if prepared is not None else _prepare_text(text)
+    return [_fuzzy_match_prepared(spaced, text_norm, pattern, threshold) for pattern in patterns]
 
 
 def extract_brand_name(text: str) -> Optional[str]:
@@ -279,45 +400,29 @@ def extract_brand_name(text: str) -> Optional[str]:
     Returns:
         Likely brand name or None
     """
-    lines = text.strip().split('\n')
-    if lines:
-        # First non-empty line is usually the brand
-        for line in lines:
-            line = line.strip()
-            if line and len(line) > 1:  # Skip single characters
-                return line
-    return None
+    # First line with at least two non-space characters is usually the brand
+    # (single characters are skipped); one search instead of splitting every line
+    match = _BRAND_LINE_RE.search(text)
+    return match.group(1) if match else None
 
 
-def extract_product_type(text: str) -> Optional[str]:
+def extract_product_type(text: str, normalized: Optional[str] = None) -> Optional[str]:
     """
     Extract product type from label text
     
     Args:
         text: OCR extracted text
+        normalized: normalize_text(text), if the caller already computed it
         
     Returns:
         Likely product type or None
     """
-    # Common alcohol product types
-    product_types = [
-        'bourbon whiskey', 'bourbon', 'whiskey', 'whisky',
-        'vodka', 'rum', 'gin', 'tequila', 'brandy',
-        'scotch', 'rye', 'cognac', 'beer', 'wine',
-        'kentucky straight bourbon whiskey'
-    ]
-    
-    text_lower = text.lower()
+    text_lower = normalized if normalized is not None else normalize_text(text)
     
-    # Find the longest matching product type
-    found_types = []
-    for ptype in product_types:
+    # Types are ordered longest first, so the first hit is the most specific match
+    for ptype in _PRODUCT_TYPES:
         if ptype in text_lower:
-            found_types.append(ptype)
-    
-    if found_types:
-        # Return longest match (more specific)
-        return max(found_types, key=len).title()
+            return ptype.title()
     
     return None
 
@@ -332,31 +437,17 @@ def extract_percentage(text: str) -> Optional[float]:
     Returns:
         Extracted percentage value or None
     """
-    # Look for patterns like "45%", "45 %", "45% ABV", "45.5%", etc.
-    patterns = [
-        r'(\d+\.?\d*)\s*%',
-        r'(\d+\.?\d*)\s*percent',
-        r'alc\.?\s*(\d+\.?\d*)',
-        r'alcohol\s*(\d+\.?\d*)',
-    ]
-    
-    for pattern in patterns:
-        matches = re.findall(pattern, text.lower())
-        if matches:
-            try:
-                return float(matches[0])
-            except ValueError:
-                continue
-    
-    return None
+    # Looks for patterns like "45%", "45 %", "45% ABV", "45.5%", etc.
+    return extract_abv_and_volume(text)[0]
 
 
-def check_sulfite_declaration(text: str) -> bool:
+def check_sulfite_declaration(text: str, normalized: Optional[str] = None) -> bool:
     """
     Check for sulfite declaration (required for wine)
     
     Args:
         text: OCR extracted text
+        normalized: normalize_text(text), if the caller already computed it
         
     Returns:
         True if sulfite declaration found
@@ -368,7 +459,7 @@ def check_sulfite_declaration(text: str) -> bool:
         "sulphite"
     ]
     
-    text_lower = text.lower()
+    text_lower = normalized if normalized is not None else normalize_text(text)
     return any(pattern in text_lower for pattern in sulfite_patterns)
 
 
@@ -383,22 +474,22 @@ def check_vintage_year(text: str) -> Optional[int]:
         Vintage year or None
     """
     # Look for 4-digit years between 1900-2099
-    pattern = r'\b(19\d{2}|20\d{2})\b'
-    matches = re.findall(pattern, text)
+    match = _VINTAGE_RE.search(text)
     
-    if matches:
+    if match:
         # Return first year found
-        return int(matches[0])
+        return int(match.group(1))
     
     return None
 
 
-def check_ingredients_list(text: str) -> bool:
+def check_ingredients_list(text: str, normalized: Optional[str] = None) -> bool:
     """
     Check for ingredients list (common on beer labels)
     
     Args:
         text: OCR extracted text
+        normalized: normalize_text(text), if the caller already computed it
         
     Returns:
         True if ingredients list appears to be present
@@ -413,10 +504,75 @@ def check_ingredients_list(text: str) -> bool:
         "malt"
     ]
     
-    text_lower = text.lower()
+    text_lower = normalized if normalized is not None else normalize_text(text)
     # Consider ingredients present if we find at least 2 keywords
-    found_count = sum(1 for keyword in ingredient_keywords if keyword in text_lower)
-    return found_count >= 2
+    found_count = 0
+    for keyword in ingredient_keywords:
+        if keyword in text_lower:
+            found_count += 1
+            if found_count >= 2:
+                return True
+    return False
+
+
+def _wine_checks(extracted_text: str, text_norm: str, checks: list[FieldCheck]) -> bool:
+    """
+    Wine-specific checks, appended to checks
+    
+    Returns:
+        False if a required wine element is missing
+    """
+    # Check for sulfite declaration (required for wine)
+    sulfite_found = check_sulfite_declaration(extracted_text, normalized=text_norm)
+    checks.append(FieldCheck(
+        field_name="Sulfite Declaration",
+        expected_value="Contains Sulfites",
+        found_value="Present" if sulfite_found else "Not found",
+        matched=sulfite_found,
+        message="✓ Sulfite declaration found on label" if sulfite_found
+                else "✗ Sulfite declaration not found (required for wine)"
+    ))
+    
+    # Check for vintage year (optional but common)
+    vintage_year = check_vintage_year(extracted_text)
+    checks.append(FieldCheck(
+        field_name="Vintage Year",
+        expected_value="Vintage year (if applicable)",
+        found_value=str(vintage_year) if vintage_year else "Not found",
+        matched=vintage_year is not None,
+        message=f"✓ Vintage year {vintage_year} found on label" if vintage_year
+                else "ℹ️ No vintage year found (optional for some wines)"
+    ))
+    # Don't fail overall match if vintage year missing (optional)
+    return sulfite_found
+
+
+def _beer_checks(extracted_text: str, text_norm: str, checks: list[FieldCheck]) -> bool:
+    """
+    Beer-specific checks, appended to checks
+    
+    Returns:
+        Always True (nothing beer-specific is required)
+    """
+    # Check for ingredients list (often present on craft beer)
+    ingredients_found = check_ingredients_list(extracted_text, normalized=text_norm)
+    checks.append(FieldCheck(
+        field_name="Ingredients",
+        expected_value="Ingredients list",
+        found_value="Present" if ingredients_found else "Not found",
+        matched=ingredients_found,
+        message="✓ Ingredients list found on label" if ingredients_found
+                else "ℹ️ Ingredients list not detected (optional but common)"
+    ))
+    # Don't fail overall match if ingredients missing (not always required)
+    return True
+
+
+# Extra checks run for each beverage type, after the common field checks
+_TYPE_SPECIFIC_CHECKS = {
+    BeverageType.WINE: _wine_checks,
+    BeverageType.BEER: _beer_checks
+}
 
 
 def verify_label_data(
@@ -444,8 +600,15 @@ def verify_label_data(
     checks = []
     all_matched = True
     
+    # Normalize the OCR text once; every text check below reuses this copy
+    prepared = _prepare_text(extracted_text)
+    text_norm = prepared[1]
+    
+    (brand_matched, found_brand), (product_matched, found_product) = fuzzy_match_many(
+        extracted_text, [brand_name, product_class], threshold=0.75, prepared=prepared
+    )
+    
     # Check 1: Brand Name
-    brand_matched, found_brand = fuzzy_match(extracted_text, brand_name, threshold=0.75)
     
     # If no match found, try to extract what brand IS on the label
     if not found_brand:
@@ -462,11 +625,9 @@ def verify_label_data(
     all_matched = all_matched and brand_matched
     
     # Check 2: Product Class/Type
-    product_matched, found_product = fuzzy_match(extracted_text, product_class, threshold=0.75)
-    
     # If no match found, try to extract what product type IS on the label
     if not found_product:
-        found_product = extract_product_type(extracted_text)
+        found_product = extract_product_type(extracted_text, normalized=text_norm)
     
     checks.append(FieldCheck(
         field_name="Product Class/Type",
@@ -478,8 +639,8 @@ def verify_label_data(
     ))
     all_matched = all_matched and product_matched
     
-    # Check 3: Alcohol Content
-    extracted_abv = extract_percentage(extracted_text)
+    # Check 3: Alcohol Content (volume for check 4 is read in the same pass)
+    extracted_abv, extracted_volume = extract_abv_and_volume(extracted_text)
     abv_matched = False
     abv_message = ""
     
@@ -505,16 +666,13 @@ def verify_label_data(
     # Check 4: Net Contents (optional)
     if net_contents:
         # Extract the volume number from the form input
-        form_volume_match = re.search(r'(\d+(?:\.\d+)?)', net_contents)
+        form_volume_match = _FORM_NUMBER_RE.search(net_contents)
         if not form_volume_match:
             # If we can't parse the form input, skip this check
             logger.warning(f"Could not parse net contents from form: {net_contents}")
         else:
             form_volume = form_volume_match.group(1)
             
-            # Extract volume from OCR text
-            extracted_volume = extract_volume(extracted_text)
-            
             if extracted_volume and form_volume == extracted_volume:
                 net_matched = True
                 net_message = f"✓ Net contents '{net_contents}' found on label"
@@ -557,44 +715,10 @@ def verify_label_data(
     # Government warning is mandatory - fail verification if non-compliant
     all_matched = all_matched and warning_compliant
     
-    # Beverage-type specific checks
-    if beverage_type == BeverageType.WINE:
-        # Check for sulfite declaration (required for wine)
-        sulfite_found = check_sulfite_declaration(extracted_text)
-        checks.append(FieldCheck(
-            field_name="Sulfite Declaration",
-            expected_value="Contains Sulfites",
-            found_value="Present" if sulfite_found else "Not found",
-            matched=sulfite_found,
-            message="✓ Sulfite declaration found on label" if sulfite_found
-                    else "✗ Sulfite declaration not found (required for wine)"
-        ))
-        all_matched = all_matched and sulfite_found
-        
-        # Check for vintage year (optional but common)
-        vintage_year = check_vintage_year(extracted_text)
-        checks.append(FieldCheck(
-            field_name="Vintage Year",
-            expected_value="Vintage year (if applicable)",
-            found_value=str(vintage_year) if vintage_year else "Not found",
-            matched=vintage_year is not None,
-            message=f"✓ Vintage year {vintage_year} found on label" if vintage_year
-                    else "ℹ️ No vintage year found (optional for some wines)"
-        ))
-        # Don't fail overall match if vintage year missing (optional)
-        
-    elif beverage_type == BeverageType.BEER:
-        # Check for ingredients list (often present on craft beer)
-        ingredients_found = check_ingredients_list(extracted_text)
-        checks.append(FieldCheck(
-            field_name="Ingredients",
-            expected_value="Ingredients list",
-            found_value="Present" if ingredients_found else "Not found",
-            matched=ingredients_found,
-            message="✓ Ingredients list found on label" if ingredients_found
-                    else "ℹ️ Ingredients list not detected (optional but common)"
-        ))
-        # Don't fail overall match if ingredients missing (not always required)
+    # Beverage-type specific checks (spirits have none)
+    type_checks = _TYPE_SPECIFIC_CHECKS.get(beverage_type)
+    if type_checks is not None:
+        all_matched = type_checks(extracted_text, text_norm, checks) and all_matched
     
     # Generate overall message
     if all_matched:
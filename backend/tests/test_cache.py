@@ -0,0 +1,48 @@
+"""
+Unit tests for the in-memory caching helpers
+"""
+import pytest
+from app.cache import LRUCache, content_hash
+
+
+class TestContentHash:
+    """Test content hashing used for cache keys"""
+    
+    def test_same_bytes_same_hash(self):
+        """Test that identical content produces the same key"""
+        assert content_hash(b"label image") == content_hash(b"label image")
+        
+    def test_different_bytes_different_hash(self):
+        """Test that different content produces different keys"""
+        assert content_hash(b"label image 1") != content_hash(b"label image 2")
+
+
+class TestLRUCache:
+    """Test the fixed-size LRU cache"""
+    
+    def test_get_missing_returns_none(self):
+        """Test that a cache miss returns None"""
+        cache = LRUCache(maxsize=2)
+        assert cache.get("missing") is None
+        
+    def test_put_and_get(self):
+        """Test that stored values are returned"""
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when full"""
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,292 @@
+"""
+Unit tests for OCR post-processing helpers
+Uses synthetic Tesseract output so no tesseract binary is required
+"""
+import io
+import numpy as np
+import pytest
+from PIL import Image
+from app.ocr import (
+    validate_image_quality,
+    _text_from_data,
+    _build_word_boxes,
+    _binarize,
+    _downscale,
+    _needs_top_pass,
+    _to_pnm,
+    _crop_to_label,
+    _parse_tsv,
+    find_tessdata_dir,
+    MAX_OCR_DIMENSION
+)
+
+
+def make_data(rows):
+    """Build a pytesseract Output.DICT-style dict from (block, par, line, word, text, conf) rows"""
+    data = {key: [] for key in (
+        'block_num', 'par_num', 'line_num', 'word_num',
+        'left', 'top', 'width', 'height', 'conf', 'text'
+    )}
+    for i, (block, par, line, word, text, conf) in enumerate(rows):
+        data['block_num'].append(block)
+        data['par_num'].append(par)
+        data['line_num'].append(line)
+        data['word_num'].append(word)
+        data['left'].append(100 + 10 * i)
+        data['top'].append(20 * line)
+        data['width'].append(50)
+        data['height'].append(15)
+        data['conf'].append(conf)
+        data['text'].append(text)
+    return data
+
+
+def make_png(width, height):
+    """Encode a noisy RGB test image as PNG bytes (noise keeps it above MIN_FILE_SIZE)"""
+    pixels = np.random.default_rng(0).integers(0, 256, (height, width, 3), dtype=np.uint8)
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class TestValidateImageQuality:
+    """Test header-only image validation"""
+
+    def test_valid_image_returns_opened_image(self):
+        """Test that a valid image is returned without decoding its pixels"""
+        is_valid, message, image = validate_image_quality(make_png(500, 600))
+        assert is_valid is True
+        assert message == "OK"
+        assert image.size == (500, 600)
+        assert image.im is None  # header parsed, pixels not yet decoded
+
+    def test_low_resolution_rejected(self):
+        """Test that images below the minimum resolution are rejected"""
+        is_valid, message, image = validate_image_quality(make_png(300, 600))
+        assert is_valid is False
+        assert "resolution too low" in message
+        assert image is None
+
+    def test_invalid_bytes_rejected(self):
+        """Test that non-image data is rejected"""
+        is_valid, message, image = validate_image_quality(b"x" * 6000)
+        assert is_valid is False
+        assert image is None
+
+
+class TestTextFromData:
+    """Test reading-order text reconstruction from image_to_data output"""
+
+    def test_groups_words_into_lines(self):
+        """Test that words on the same line are joined with spaces"""
+        data = make_data([
+            (1, 1, 1, 1, "EAGLE", 95),
+            (1, 1, 1, 2, "PEAK", 94),
+            (1, 1, 2, 1, "BOURBON", 90),
+        ])
+        assert _text_from_data(data) == "EAGLE PEAK\nBOURBON"
+
+    def test_sorts_by_block_and_word_order(self):
+        """Test that rows are ordered by block/paragraph/line/word numbers"""
+        data = make_data([
+            (2, 1, 1, 1, "750", 90),
+            (1, 1, 1, 2, "PEAK", 94),
+            (1, 1, 1, 1, "EAGLE", 95),
+        ])
+        assert _text_from_data(data) == "EAGLE PEAK\n750"
+
+    def test_drops_low_confidence_and_empty_words(self):
+        """Test that structural rows and noisy words are skipped"""
+        data = make_data([
+            (1, 0, 0, 0, "", -1),
+            (1, 1, 1, 1, "EAGLE", 95),
+            (1, 1, 1, 2, "~", 12),
+        ])
+        assert _text_from_data(data) == "EAGLE"
+
+
+class TestBuildWordBoxes:
+    """Test word bounding box assembly"""
+
+    def test_lowercases_words(self):
+        """Test that words are keyed by lowercase text"""
+        data = make_data([(1, 1, 1, 1, "EAGLE", 95)])
+        word_boxes = _build_word_boxes(data)
+        assert word_boxes["eagle"][0]["conf"] == 95
+
+    def test_skips_low_confidence(self):
+        """Test that low-confidence words are not highlighted"""
+        data = make_data([(1, 1, 1, 1, "EAGLE", 20)])
+        assert _build_word_boxes(data) == {}
+
+    def test_repeated_words_collected(self):
+        """Test that a word seen twice maps to a list of both boxes"""
+        data = make_data([
+            (1, 1, 1, 1, "Bourbon", 95),
+            (1, 1, 2, 1, "BOURBON", 90),
+        ])
+        word_boxes = _build_word_boxes(data)
+        assert [box["conf"] for box in word_boxes["bourbon"]] == [95, 90]
+
+    def test_boxes_mapped_back_to_original_scale(self):
+        """Test that boxes from a downscaled image are reported in original pixels"""
+        data = make_data([(1, 1, 1, 1, "EAGLE", 95)])
+        box = _build_word_boxes(data, scale=0.5)["eagle"][0]
+        assert (box["left"], box["top"], box["width"], box["height"]) == (200, 40, 100, 30)
+
+    def test_boxes_shifted_by_crop_offset(self):
+        """Test that boxes from a cropped image are shifted back before rescaling"""
+        data = make_data([(1, 1, 1, 1, "EAGLE", 95)])
+        box = _build_word_boxes(data, scale=0.5, offset=(50, 30))["eagle"][0]
+        assert (box["left"], box["top"], box["width"], box["height"]) == (300, 100, 100, 30)
+
+
+class TestDownscale:
+    """Test downscaling of oversized images before OCR"""
+
+    def test_small_image_untouched(self):
+        """Test that images within the limit are not resized"""
+        image = Image.new("RGB", (800, 1200))
+        resized, scale = _downscale(image)
+        assert resized is image
+        assert scale == 1.0
+
+    def test_large_image_downscaled(self):
+        """Test that the longest edge is capped at MAX_OCR_DIMENSION"""
+        image = Image.new("RGB", (3000, 2000))
+        resized, scale = _downscale(image)
+        assert max(resized.size) == MAX_OCR_DIMENSION
+        assert scale == MAX_OCR_DIMENSION / 3000
+
+
+class TestBinarize:
+    """Test CLAHE + Otsu binarization used for the PSM 11 top-area pass"""
+
+    def test_output_is_binary(self):
+        """Test that a low-contrast gradient is mapped to pure black and white"""
+        gray = np.tile(np.linspace(100, 140, 200, dtype=np.uint8), (100, 1))
+        binary = _binarize(gray)
+        assert binary.shape == gray.shape
+        assert set(np.unique(binary)) <= {0, 255}
+
+
+class TestCropToLabel:
+    """Test cropping photos to the text-bearing label region"""
+
+    def test_crops_to_label_on_plain_background(self):
+        """Test that a busy label on a flat background is cropped with padding"""
+        gray = np.full((1000, 800), 90, dtype=np.uint8)
+        gray[200:800, 100:700] = np.random.default_rng(0).integers(0, 256, (600, 600), dtype=np.uint8)
+        cropped, (left, top) = _crop_to_label(gray)
+        assert 40 <= left < 100 and 140 <= top < 200
+        assert cropped.shape[0] < 1000 and cropped.shape[1] < 800
+        assert cropped.shape[0] >= 600 and cropped.shape[1] >= 600
+
+    def test_small_region_falls_back_to_full_image(self):
+        """Test that a region under LABEL_CROP_MIN_AREA is treated as noise"""
+        gray = np.full((1000, 800), 90, dtype=np.uint8)
+        gray[100:300, 100:300] = 255
+        cropped, offset = _crop_to_label(gray)
+        assert cropped is gray
+        assert offset == (0, 0)
+
+    def test_blank_image_untouched(self):
+        """Test that an image without edges is not cropped"""
+        gray = np.full((500, 500), 200, dtype=np.uint8)
+        cropped, offset = _crop_to_label(gray)
+        assert cropped is gray
+        assert offset == (0, 0)
+
+
+class TestNeedsTopPass:
+    """Test the decision to re-read the top of the label with PSM 11"""
+
+    def test_confident_top_words_skip_second_pass(self):
+        """Test that enough confident words in the top area skip the extra pass"""
+        # make_data places line N at top=20*N, inside the 10%-40% band of a 200px image
+        data = make_data([
+            (1, 1, 1, 1, "EAGLE", 95),
+            (1, 1, 1, 2, "PEAK", 94),
+            (1, 1, 2, 1, "BOURBON", 90),
+        ])
+        assert _needs_top_pass(data, height=200, width=400) is False
+
+    def test_low_confidence_top_words_trigger_second_pass(self):
+        """Test that a poorly read top area triggers the extra pass"""
+        data = make_data([
+            (1, 1, 1, 1, "EAGLE", 40),
+            (1, 1, 1, 2, "PEAK", 45),
+            (1, 1, 2, 1, "BOURBON", 90),
+        ])
+        assert _needs_top_pass(data, height=200, width=400) is True
+
+
+class TestToPnm:
+    """Test PNM encoding of images piped to the tesseract CLI"""
+
+    def test_grayscale_is_pgm(self):
+        """Test that 2-D arrays are written as binary PGM with raw pixels"""
+        gray = np.arange(6, dtype=np.uint8).reshape(2, 3)
+        assert _to_pnm(gray) == b"P5\n3 2\n255\n" + bytes(range(6))
+
+    def test_rgb_image_is_ppm(self):
+        """Test that RGB PIL images are written as binary PPM"""
+        pnm = _to_pnm(Image.new("RGB", (4, 2), (1, 2, 3)))
+        assert pnm.startswith(b"P6\n4 2\n255\n")
+        assert pnm.endswith(b"\x01\x02\x03" * 8)
+
+
+class TestParseTsv:
+    """Test parsing of tesseract TSV output"""
+
+    TSV = (
+        "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\tleft\ttop\twidth\theight\tconf\ttext\n"
+        "1\t1\t0\t0\t0\t0\t0\t0\t800\t600\t-1\t\n"
+        "5\t1\t1\t1\t1\t1\t120\t40\t90\t30\t96.5\tEAGLE\n"
+        "5\t1\t1\t1\t1\t2\t220\t40\t70\t30\t91.0\tPEAK\n"
+    )
+
+    def test_columns_match_image_to_data(self):
+        """Test that rows are parsed into image_to_data-style columns"""
+        data = _parse_tsv(self.TSV)
+        assert data["text"] == ["", "EAGLE", "PEAK"]
+        assert data["conf"] == [-1, 96, 91]
+        assert data["left"] == [0, 120, 220]
+
+    def test_feeds_text_reconstruction(self):
+        """Test that parsed output works with the text helpers"""
+        assert _text_from_data(_parse_tsv(self.TSV)) == "EAGLE PEAK"
+
+    def test_empty_output(self):
+        """Test that empty output yields empty columns"""
+        assert _parse_tsv("")["text"] == []
+
+
+class TestFindTessdataDir:
+    """Test locating tessdata for the persistent tesserocr handle"""
+
+    def test_env_var_wins(self, monkeypatch):
+        """Test that TESSDATA_PREFIX is used as-is when set"""
+        monkeypatch.setenv("TESSDATA_PREFIX", "/opt/tessdata")
+        assert find_tessdata_dir() == "/opt/tessdata"
+
+    def test_probes_system_dirs_for_eng_model(self, monkeypatch, tmp_path):
+        """Test that the newest version directory with eng.traineddata is picked"""
+        monkeypatch.delenv("TESSDATA_PREFIX", raising=False)
+        for version in ("4.00", "5"):
+            (tmp_path / version / "tessdata").mkdir(parents=True)
+        (tmp_path / "4.00" / "tessdata" / "eng.traineddata").touch()
+        (tmp_path / "5" / "tessdata" / "eng.traineddata").touch()
+        monkeypatch.setattr("app.ocr.TESSDATA_SEARCH_PATTERNS", (str(tmp_path / "*" / "tessdata"),))
+        assert find_tessdata_dir() == str(tmp_path / "5" / "tessdata")
+
+    def test_none_when_nothing_found(self, monkeypatch, tmp_path):
+        """Test that None is returned when no directory holds the English model"""
+        monkeypatch.delenv("TESSDATA_PREFIX", raising=False)
+        (tmp_path / "tessdata").mkdir()
+        monkeypatch.setattr("app.ocr.TESSDATA_SEARCH_PATTERNS", (str(tmp_path / "tessdata"),))
+        assert find_tessdata_dir() is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -3,14 +3,20 @@ Unit tests for OCR and verification logic
 Tests the core functionality without requiring actual image processing
 """
 import pytest
+from pydantic import ValidationError
 from app.verification import (
     fuzzy_match,
+    fuzzy_match_many,
     extract_percentage,
     extract_volume,
+    extract_abv_and_volume,
     normalize_text,
     extract_brand_name,
     extract_product_type,
-    verify_label_data
+    verify_label_data,
+    validate_warning_compliance,
+    REQUIRED_WARNING_TEXT,
+    MAX_FUZZY_TEXT_LENGTH
 )
 
 
@@ -53,6 +59,26 @@ class TestFuzzyMatching:
         """Test that similar but not identical strings match with lower threshold"""
         matched, found = fuzzy_match("Eagle Peaks Bourbon", "Eagle Peak", threshold=0.75)
         assert matched is True
+        
+    def test_found_text_is_whole_words_in_original_case(self):
+        """Test that a fuzzy match reports the label's own words"""
+        matched, found = fuzzy_match("Distilled by\nEAGIE  PEAK Bourbon Co", "Eagle Peak", threshold=0.75)
+        assert matched is True
+        assert found == "EAGIE PEAK"
+        
+    def test_match_many_agrees_with_single_matches(self):
+        """Test that batched matching returns the same results as one call per pattern"""
+        text = "EAGLE PEAK\nBourbon Whiskey\n45% Alc./Vol."
+        patterns = ["Eagle Peak", "Bourbon Whisky", "Sunset Ridge"]
+        results = fuzzy_match_many(text, patterns, threshold=0.75)
+        assert results == [fuzzy_match(text, pattern, threshold=0.75) for pattern in patterns]
+        assert [matched for matched, _ in results] == [True, True, False]
+
+    def test_fuzzy_search_limited_to_start_of_text(self):
+        """Test that fuzzy matching stops at MAX_FUZZY_TEXT_LENGTH but exact matches do not"""
+        text = "x " * MAX_FUZZY_TEXT_LENGTH + "EAGIE PEAK"
+        assert fuzzy_match(text, "Eagle Peak", threshold=0.75)[0] is False
+        assert fuzzy_match(text, "Eagie Peak", threshold=0.75)[0] is True
 
 
 class TestTextNormalization:
@@ -107,6 +133,11 @@ class TestPercentageExtraction:
         result = extract_percentage("alc. 45")
         assert result == 45.0
         
+    def test_percent_sign_preferred_over_alcohol_prefix(self):
+        """Test that the first '%' value wins even after an 'alcohol' prefix"""
+        result = extract_percentage("Alcohol 45% by volume, bottled at 40%")
+        assert result == 45.0
+        
     def test_no_percentage_found(self):
         """Test that None is returned when no percentage found"""
         result = extract_percentage("Just text without numbers")
@@ -146,12 +177,35 @@ class TestVolumeExtraction:
         result = extract_volume("750.5 mL")
         assert result == "750.5"
         
+    def test_ml_preferred_over_earlier_liters(self):
+        """Test that mL takes priority over an earlier liter match"""
+        result = extract_volume("Est. 2019 Limited Release 750 mL")
+        assert result == "750"
+        
     def test_no_volume_found(self):
         """Test that None is returned when no volume found"""
         result = extract_volume("Just text without volume")
         assert result is None
 
 
+class TestAbvAndVolumeExtraction:
+    """Test single-pass extraction of alcohol content and volume"""
+    
+    def test_both_fields_from_label_text(self):
+        """Test that both values are read from typical label text"""
+        result = extract_abv_and_volume("EAGLE PEAK\n45% Alc./Vol.\n750 mL")
+        assert result == (45.0, "750")
+        
+    def test_matches_separate_extractors(self):
+        """Test that the combined scan agrees with the single-field helpers"""
+        text = "Alcohol 40 by volume, 1 L bottle, 750 mL, 13.5 percent"
+        assert extract_abv_and_volume(text) == (extract_percentage(text), extract_volume(text))
+        
+    def test_neither_found(self):
+        """Test that missing values are None"""
+        assert extract_abv_and_volume("Just text") == (None, None)
+
+
 class TestBrandExtraction:
     """Test brand name extraction from OCR text"""
     
@@ -201,6 +255,37 @@ class TestProductTypeExtraction:
         assert result is None
 
 
+class TestWarningCompliance:
+    """Test the detailed government warning check (27 CFR 16.21)"""
+    
+    def test_required_text_is_compliant(self):
+        """Test that the exact regulatory text passes"""
+        is_compliant, violations = validate_warning_compliance(REQUIRED_WARNING_TEXT)
+        assert is_compliant is True
+        assert violations == []
+        
+    def test_altered_birth_defects_wording_reported(self):
+        """Test that 'birth effects' is not accepted for 'birth defects'"""
+        text = REQUIRED_WARNING_TEXT.replace("birth defects", "birth effects")
+        is_compliant, violations = validate_warning_compliance(text)
+        assert is_compliant is False
+        assert "Missing required phrase: 'birth defects warning'" in violations
+        
+    def test_altered_machinery_wording_reported(self):
+        """Test that 'operate heavy machinery' is not accepted for 'operate machinery'"""
+        text = REQUIRED_WARNING_TEXT.replace("operate machinery", "operate heavy machinery")
+        is_compliant, violations = validate_warning_compliance(text)
+        assert is_compliant is False
+        assert "Missing required phrase: 'driving/machinery warning'" in violations
+        
+    def test_missing_phrase_reported(self):
+        """Test that a phrase that is actually absent is still reported"""
+        text = REQUIRED_WARNING_TEXT.replace(", and may cause health problems", "")
+        is_compliant, violations = validate_warning_compliance(text)
+        assert is_compliant is False
+        assert "Missing required phrase: 'health problems warning'" in violations
+
+
 class TestVerifyLabelData:
     """Integration tests for full label verification"""
     
@@ -308,6 +393,18 @@ class TestVerifyLabelData:
         net_check = next(c for c in result.checks if c.field_name == "Net Contents")
         assert net_check.matched is False
 
+    def test_result_is_immutable(self):
+        """Test that verification results are frozen models"""
+        result = verify_label_data(
+            extracted_text="BRAND\nBOURBON\n45% ABV\n750 mL",
+            brand_name="Brand",
+            product_class="Bourbon",
+            alcohol_content=45.0
+        )
+        
+        with pytest.raises(ValidationError):
+            result.overall_match = True
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
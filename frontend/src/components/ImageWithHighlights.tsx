@@ -46,8 +46,7 @@ const ImageWithHighlights: React.FC<Props> = ({ imageUrl, verificationResult })
         warningWords.forEach((word) => {
           const boxes = verificationResult.word_boxes?.[word.toLowerCase()];
           if (boxes) {
-            const boxArray = Array.isArray(boxes) ? boxes : [boxes];
-            allBoxes.push(...boxArray);
+            allBoxes.push(...boxes);
           }
         });
         
@@ -94,8 +93,7 @@ const ImageWithHighlights: React.FC<Props> = ({ imageUrl, verificationResult })
               wordsToHighlight.forEach((word) => {
                 const boxes = verificationResult.word_boxes?.[word.toLowerCase()];
                 if (boxes) {
-                  const boxArray = Array.isArray(boxes) ? boxes : [boxes];
-                  boxArray.forEach((box) => {
+                  boxes.forEach((box) => {
                     ctx.strokeStyle = '#ef4444';
                     ctx.lineWidth = 3;
                     ctx.strokeRect(box.left, box.top, box.width, box.height);
@@ -126,9 +124,7 @@ const ImageWithHighlights: React.FC<Props> = ({ imageUrl, verificationResult })
           const boxes = verificationResult.word_boxes?.[word.toLowerCase()];
           if (!boxes) return;
 
-          const boxArray = Array.isArray(boxes) ? boxes : [boxes];
-
-          boxArray.forEach((box) => {
+          boxes.forEach((box) => {
             // Green for matched
             ctx.strokeStyle = '#10b981';
             ctx.lineWidth = 3;
@@ -160,9 +156,7 @@ const ImageWithHighlights: React.FC<Props> = ({ imageUrl, verificationResult })
             const boxes = verificationResult.word_boxes?.[cleanWord.toLowerCase()] || verificationResult.word_boxes?.[word.toLowerCase()];
             
             if (boxes) {
-              const boxArray = Array.isArray(boxes) ? boxes : [boxes];
-
-              boxArray.forEach((box) => {
+              boxes.forEach((box) => {
                 // Red for mismatched
                 ctx.strokeStyle = '#ef4444';
                 ctx.lineWidth = 3;
@@ -202,7 +196,7 @@ const ImageWithHighlights: React.FC<Props> = ({ imageUrl, verificationResult })
           }
           
           if (boxes) {
-            const box = Array.isArray(boxes) ? boxes[0] : boxes;
+            const box = boxes[0];
             labelY = box.top - 5;
             labelX = box.left;
             labelText = check.matched ? 'Alcohol Content (%)' : `Alcohol Content (%) (Found: ${check.found_value})`;
@@ -231,7 +225,7 @@ const ImageWithHighlights: React.FC<Props> = ({ imageUrl, verificationResult })
       const boxes = verificationResult.word_boxes?.[firstWord];
       
       if (boxes) {
-        const box = Array.isArray(boxes) ? boxes[0] : boxes;
+        const box = boxes[0];
         labelY = box.top - 5;
         labelX = box.left;
         labelText = check.matched ? check.field_name : `${check.field_name} (Found: ${check.found_value})`;
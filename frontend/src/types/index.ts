@@ -22,7 +22,7 @@ export interface VerificationResponse {
   message: string;
   extracted_text: string;
   checks: FieldCheck[];
-  word_boxes?: Record<string, BoundingBox | BoundingBox[]>;
+  word_boxes?: Record<string, BoundingBox[]>;
 }
 
 export interface FormData {
@@ -0,0 +1,19 @@
+"""
+Shared font cache for the label generator scripts
+Each (path, size) TrueType font is parsed once per run instead of once per label
+"""
+from PIL import ImageFont
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def load_font(path, size):
+    """Cached ImageFont.truetype, falling back to Pillow's default font at the same size"""
+    # Label text is plain ASCII, so the basic layout engine is enough; it skips
+    # Raqm/HarfBuzz shaping and renders the same whether or not Raqm is installed
+    try:
+        return ImageFont.truetype(path, size, layout_engine=ImageFont.Layout.BASIC)
+    except OSError:
+        # The generators name macOS system fonts; elsewhere (e.g. Linux CI) use the
+        # scalable default so titles and warnings keep their intended sizes
+        return ImageFont.load_default(size)
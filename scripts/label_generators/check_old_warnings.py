@@ -6,6 +6,14 @@ from PIL import Image
 import os
 import re
 
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+# Warning section from the header to the end of the statutory text
+WARNING_RE = re.compile(r'GOVERNMENT WARNING:.*?(?:health problems|$)', re.DOTALL | re.IGNORECASE)
+
 old_labels = [
     'test_labels/clear_bourbon.png',
     'test_labels/low_contrast_vodka.png',
@@ -23,49 +31,70 @@ old_labels = [
     'test_labels/product_types/wine_label.png',
 ]
 
+
+def ocr_labels(paths):
+    """Yield (path, text) for each label, reusing one Tesseract handle when tesserocr is usable"""
+    api = None
+    if tesserocr is not None:
+        try:
+            api = tesserocr.PyTessBaseAPI()
+        except RuntimeError as e:
+            # Installed but without usable tessdata (e.g. the pip wheel's default "./")
+            print(f'tesserocr unavailable, using pytesseract instead: {e}')
+    
+    if api is None:
+        # Fallback: one tesseract process per image
+        for path in paths:
+            yield path, pytesseract.image_to_string(Image.open(path))
+        return
+    
+    with api:
+        for path in paths:
+            api.SetImage(Image.open(path))
+            yield path, api.GetUTF8Text()
+
+
 print('=' * 80)
 print('CHECKING OLD TEST LABELS FOR GOVERNMENT WARNING COMPLIANCE')
 print('=' * 80)
 
 labels_with_warnings = []
 
-for label in old_labels:
-    if os.path.exists(label):
-        img = Image.open(label)
-        text = pytesseract.image_to_string(img)
+for label, text in ocr_labels([label for label in old_labels if os.path.exists(label)]):
+    # Lowercase once for the case-insensitive checks below
+    text_lower = text.lower()
+    
+    # Check if has government warning
+    has_warning = 'government warning' in text_lower
+    
+    if has_warning:
+        # Extract warning text
+        match = WARNING_RE.search(text)
+        
+        warning_text = match.group(0) if match else "Could not extract"
+        
+        # Check for compliance issues
+        issues = []
+        if 'surgeon general' in text_lower and 'Surgeon General' not in text:
+            issues.append('lowercase "surgeon general"')
+        if '(1)' not in text:
+            issues.append('missing statement (1)')
+        if '(2)' not in text:
+            issues.append('missing statement (2)')
         
-        # Check if has government warning
-        has_warning = 'GOVERNMENT WARNING' in text.upper()
+        labels_with_warnings.append({
+            'path': label,
+            'issues': issues,
+            'warning_snippet': warning_text[:100] + '...' if len(warning_text) > 100 else warning_text
+        })
         
-        if has_warning:
-            # Extract warning text
-            pattern = r'GOVERNMENT WARNING:.*?(?:health problems|$)'
-            match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
-            
-            warning_text = match.group(0) if match else "Could not extract"
-            
-            # Check for compliance issues
-            issues = []
-            if 'surgeon general' in text.lower() and 'Surgeon General' not in text:
-                issues.append('lowercase "surgeon general"')
-            if '(1)' not in text:
-                issues.append('missing statement (1)')
-            if '(2)' not in text:
-                issues.append('missing statement (2)')
-            
-            labels_with_warnings.append({
-                'path': label,
-                'issues': issues,
-                'warning_snippet': warning_text[:100] + '...' if len(warning_text) > 100 else warning_text
-            })
-            
-            status = '❌ NON-COMPLIANT' if issues else '✅ COMPLIANT'
-            print(f'\n{status}: {label}')
-            if issues:
-                for issue in issues:
-                    print(f'  - {issue}')
-        else:
-            print(f'\n⚪ NO WARNING: {label}')
+        status = '❌ NON-COMPLIANT' if issues else '✅ COMPLIANT'
+        print(f'\n{status}: {label}')
+        if issues:
+            for issue in issues:
+                print(f'  - {issue}')
+    else:
+        print(f'\n⚪ NO WARNING: {label}')
 
 print('\n' + '=' * 80)
 print(f'SUMMARY: {len(labels_with_warnings)} labels with warnings found')
@@ -3,11 +3,39 @@ Create test labels for different beverage types with compliant warnings
 - Wine label with sulfites and compliant warning
 - Beer label with ingredients and compliant warning
 """
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
+from _fontcache import load_font
 import os
 
 COMPLIANT_WARNING = """GOVERNMENT WARNING: (1) According to the Surgeon General, women should not drink alcoholic beverages during pregnancy because of the risk of birth defects. (2) Consumption of alcoholic beverages impairs your ability to drive a car or operate machinery, and may cause health problems."""
 
+# COMPLIANT_WARNING split into the centered lines drawn on both labels
+WARNING_LINES = [
+    "GOVERNMENT WARNING: (1) According to the Surgeon General,",
+    "women should not drink alcoholic beverages during pregnancy",
+    "because of the risk of birth defects. (2) Consumption of",
+    "alcoholic beverages impairs your ability to drive a car or",
+    "operate machinery, and may cause health problems."
+]
+
+
+def get_font(size):
+    """Helvetica at the given size (fallback to default)"""
+    return load_font("/System/Library/Fonts/Helvetica.ttc", size)
+
+
+def draw_centered(draw, text, y, font, width, fill='black'):
+    """Draw text horizontally centered on a label of the given width (top at y)"""
+    draw.text((width // 2, y), text, fill=fill, font=font, anchor='ma')
+
+
+def draw_warning(draw, y, font, width, line_height=22):
+    """Draw WARNING_LINES centered, starting at y"""
+    for line in WARNING_LINES:
+        draw_centered(draw, line, y, font, width)
+        y += line_height
+
+
 def create_wine_label():
     """Create a wine label with sulfites and compliant warning"""
     
@@ -15,75 +43,44 @@ def create_wine_label():
     image = Image.new('RGB', (width, height), 'white')
     draw = ImageDraw.Draw(image)
     
-    try:
-        title_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 60)
-        medium_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 28)
-        small_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 16)
-    except:
-        title_font = ImageFont.load_default()
-        medium_font = ImageFont.load_default()
-        small_font = ImageFont.load_default()
+    title_font = get_font(60)
+    medium_font = get_font(28)
+    small_font = get_font(16)
     
     # Border
     draw.rectangle([(20, 20), (width-20, height-20)], outline='darkred', width=4)
     
     # Brand
     brand_text = "CHÂTEAU VALLEY"
-    bbox = draw.textbbox((0, 0), brand_text, font=title_font)
-    brand_width = bbox[2] - bbox[0]
-    draw.text(((width - brand_width) // 2, 70), brand_text, fill='darkred', font=title_font)
+    draw_centered(draw, brand_text, 70, title_font, width, fill='darkred')
     
     draw.line([(60, 160), (width-60, 160)], fill='darkred', width=2)
     
     # Product type
     product_text = "CABERNET SAUVIGNON"
-    bbox = draw.textbbox((0, 0), product_text, font=medium_font)
-    product_width = bbox[2] - bbox[0]
-    draw.text(((width - product_width) // 2, 200), product_text, fill='black', font=medium_font)
+    draw_centered(draw, product_text, 200, medium_font, width)
     
     # Vintage
     vintage_text = "2019"
-    bbox = draw.textbbox((0, 0), vintage_text, font=medium_font)
-    vintage_width = bbox[2] - bbox[0]
-    draw.text(((width - vintage_width) // 2, 250), vintage_text, fill='black', font=medium_font)
+    draw_centered(draw, vintage_text, 250, medium_font, width)
     
     # ABV
     abv_text = "13.5% Alc./Vol."
-    bbox = draw.textbbox((0, 0), abv_text, font=medium_font)
-    abv_width = bbox[2] - bbox[0]
-    draw.text(((width - abv_width) // 2, 310), abv_text, fill='black', font=medium_font)
+    draw_centered(draw, abv_text, 310, medium_font, width)
     
     # Net Contents
     net_text = "750 mL"
-    bbox = draw.textbbox((0, 0), net_text, font=medium_font)
-    net_width = bbox[2] - bbox[0]
-    draw.text(((width - net_width) // 2, 370), net_text, fill='black', font=medium_font)
+    draw_centered(draw, net_text, 370, medium_font, width)
     
     # SULFITES WARNING
     sulfites_text = "CONTAINS SULFITES"
-    bbox = draw.textbbox((0, 0), sulfites_text, font=medium_font)
-    sulfites_width = bbox[2] - bbox[0]
-    draw.text(((width - sulfites_width) // 2, 430), sulfites_text, fill='black', font=medium_font)
+    draw_centered(draw, sulfites_text, 430, medium_font, width)
     
     # COMPLIANT Government Warning
-    warning_lines = [
-        "GOVERNMENT WARNING: (1) According to the Surgeon General,",
-        "women should not drink alcoholic beverages during pregnancy",
-        "because of the risk of birth defects. (2) Consumption of",
-        "alcoholic beverages impairs your ability to drive a car or",
-        "operate machinery, and may cause health problems."
-    ]
-    
-    y_position = 520
-    for line in warning_lines:
-        bbox = draw.textbbox((0, 0), line, font=small_font)
-        line_width = bbox[2] - bbox[0]
-        draw.text(((width - line_width) // 2, y_position), line, fill='black', font=small_font)
-        y_position += 22
+    draw_warning(draw, 520, small_font, width)
     
     # Save
     output_path = 'test_labels/compliance_tests/wine_compliant.png'
-    os.makedirs('test_labels/compliance_tests', exist_ok=True)
     image.save(output_path, 'PNG')
     print(f"✅ Created wine label with compliant warning: {output_path}")
 
@@ -95,70 +92,40 @@ def create_beer_label():
     image = Image.new('RGB', (width, height), 'white')
     draw = ImageDraw.Draw(image)
     
-    try:
-        title_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 70)
-        medium_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 28)
-        small_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 16)
-    except:
-        title_font = ImageFont.load_default()
-        medium_font = ImageFont.load_default()
-        small_font = ImageFont.load_default()
+    title_font = get_font(70)
+    medium_font = get_font(28)
+    small_font = get_font(16)
     
     # Border
     draw.rectangle([(20, 20), (width-20, height-20)], outline='goldenrod', width=4)
     
     # Brand
     brand_text = "SUMMIT BREW"
-    bbox = draw.textbbox((0, 0), brand_text, font=title_font)
-    brand_width = bbox[2] - bbox[0]
-    draw.text(((width - brand_width) // 2, 70), brand_text, fill='darkorange', font=title_font)
+    draw_centered(draw, brand_text, 70, title_font, width, fill='darkorange')
     
     draw.line([(60, 170), (width-60, 170)], fill='goldenrod', width=2)
     
     # Product type
     product_text = "INDIA PALE ALE"
-    bbox = draw.textbbox((0, 0), product_text, font=medium_font)
-    product_width = bbox[2] - bbox[0]
-    draw.text(((width - product_width) // 2, 210), product_text, fill='black', font=medium_font)
+    draw_centered(draw, product_text, 210, medium_font, width)
     
     # ABV
     abv_text = "6.5% Alc./Vol."
-    bbox = draw.textbbox((0, 0), abv_text, font=medium_font)
-    abv_width = bbox[2] - bbox[0]
-    draw.text(((width - abv_width) // 2, 270), abv_text, fill='black', font=medium_font)
+    draw_centered(draw, abv_text, 270, medium_font, width)
     
     # Net Contents
     net_text = "355 mL"
-    bbox = draw.textbbox((0, 0), net_text, font=medium_font)
-    net_width = bbox[2] - bbox[0]
-    draw.text(((width - net_width) // 2, 330), net_text, fill='black', font=medium_font)
+    draw_centered(draw, net_text, 330, medium_font, width)
     
     # INGREDIENTS
     ingredients_title = "INGREDIENTS:"
-    bbox = draw.textbbox((0, 0), ingredients_title, font=medium_font)
-    ing_width = bbox[2] - bbox[0]
-    draw.text(((width - ing_width) // 2, 390), ingredients_title, fill='black', font=medium_font)
+    draw_centered(draw, ingredients_title, 390, medium_font, width)
     
     ingredients_text = "Water, Malted Barley, Hops, Yeast"
-    bbox = draw.textbbox((0, 0), ingredients_text, font=small_font)
-    ing_text_width = bbox[2] - bbox[0]
-    draw.text(((width - ing_text_width) // 2, 425), ingredients_text, fill='black', font=small_font)
+    draw_centered(draw, ingredients_text, 425, small_font, width)
     
     # COMPLIANT Government Warning
-    warning_lines = [
-        "GOVERNMENT WARNING: (1) According to the Surgeon General,",
-        "women should not drink alcoholic beverages during pregnancy",
-        "because of the risk of birth defects. (2) Consumption of",
-        "alcoholic beverages impairs your ability to drive a car or",
-        "operate machinery, and may cause health problems."
-    ]
-    
-    y_position = 510
-    for line in warning_lines:
-        bbox = draw.textbbox((0, 0), line, font=small_font)
-        line_width = bbox[2] - bbox[0]
-        draw.text(((width - line_width) // 2, y_position), line, fill='black', font=small_font)
-        y_position += 22
+    draw_warning(draw, 510, small_font, width)
     
     # Save
     output_path = 'test_labels/compliance_tests/beer_compliant.png'
@@ -167,6 +134,8 @@ def create_beer_label():
 
 
 if __name__ == '__main__':
+    # Create compliance tests directory (here, so importing the module has no side effects)
+    os.makedirs('test_labels/compliance_tests', exist_ok=True)
     print("Creating beverage type test labels with compliant warnings...\n")
     create_wine_label()
     create_beer_label()
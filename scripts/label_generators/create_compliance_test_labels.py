@@ -3,56 +3,62 @@ Create test labels to validate detailed government warning compliance
 - Compliant warning (exact text)
 - Non-compliant warnings (various violations)
 """
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
+from _fontcache import load_font
+from functools import lru_cache
 import os
 
 # Official TTB warning text
 COMPLIANT_WARNING = """GOVERNMENT WARNING: (1) According to the Surgeon General, women should not drink alcoholic beverages during pregnancy because of the risk of birth defects. (2) Consumption of alcoholic beverages impairs your ability to drive a car or operate machinery, and may cause health problems."""
 
-def create_compliant_label():
-    """Create a label with fully compliant government warning"""
-    
-    width, height = 800, 1000
+LABEL_SIZE = (800, 1000)
+
+
+def get_fonts():
+    """Load the title, medium and small fonts (cached per size by load_font)"""
+    title_font = load_font("/System/Library/Fonts/Helvetica.ttc", 70)
+    medium_font = load_font("/System/Library/Fonts/Helvetica.ttc", 30)
+    small_font = load_font("/System/Library/Fonts/Helvetica.ttc", 16)
+    return title_font, medium_font, small_font
+
+
+@lru_cache(maxsize=None)
+def base_label():
+    """Blank label with the border and divider shared by every variant (copy before drawing)"""
+    width, height = LABEL_SIZE
     image = Image.new('RGB', (width, height), 'white')
     draw = ImageDraw.Draw(image)
-    
-    try:
-        title_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 70)
-        medium_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 30)
-        small_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 16)
-    except:
-        title_font = ImageFont.load_default()
-        medium_font = ImageFont.load_default()
-        small_font = ImageFont.load_default()
-    
-    # Border
     draw.rectangle([(20, 20), (width-20, height-20)], outline='black', width=3)
-    
-    # Brand
-    brand_text = "EAGLE PEAK"
-    bbox = draw.textbbox((0, 0), brand_text, font=title_font)
-    brand_width = bbox[2] - bbox[0]
-    draw.text(((width - brand_width) // 2, 80), brand_text, fill='black', font=title_font)
-    
     draw.line([(60, 180), (width-60, 180)], fill='black', width=2)
+    return image
+
+
+def draw_centered(draw, text, y, font):
+    """Draw text horizontally centered on the label (top at y)"""
+    draw.text((LABEL_SIZE[0] // 2, y), text, fill='black', font=font, anchor='ma')
+
+
+def create_label(brand_text, product_text, abv_text, net_text, warning_lines):
+    """Draw a label from a copy of the shared base and return the image"""
+    title_font, medium_font, small_font = get_fonts()
+    image = base_label().copy()
+    draw = ImageDraw.Draw(image)
     
-    # Product type
-    product_text = "BOURBON WHISKEY"
-    bbox = draw.textbbox((0, 0), product_text, font=medium_font)
-    product_width = bbox[2] - bbox[0]
-    draw.text(((width - product_width) // 2, 220), product_text, fill='black', font=medium_font)
+    draw_centered(draw, brand_text, 80, title_font)
+    draw_centered(draw, product_text, 220, medium_font)
+    draw_centered(draw, abv_text, 280, medium_font)
+    draw_centered(draw, net_text, 340, medium_font)
     
-    # ABV
-    abv_text = "45% Alc./Vol."
-    bbox = draw.textbbox((0, 0), abv_text, font=medium_font)
-    abv_width = bbox[2] - bbox[0]
-    draw.text(((width - abv_width) // 2, 280), abv_text, fill='black', font=medium_font)
+    y_position = 450
+    for line in warning_lines:
+        draw_centered(draw, line, y_position, small_font)
+        y_position += 22
     
-    # Net Contents
-    net_text = "750 mL"
-    bbox = draw.textbbox((0, 0), net_text, font=medium_font)
-    net_width = bbox[2] - bbox[0]
-    draw.text(((width - net_width) // 2, 340), net_text, fill='black', font=medium_font)
+    return image
+
+
+def create_compliant_label():
+    """Create a label with fully compliant government warning"""
     
     # COMPLIANT Government Warning
     warning_lines = [
@@ -63,16 +69,9 @@ def create_compliant_label():
         "operate machinery, and may cause health problems."
     ]
     
-    y_position = 450
-    for line in warning_lines:
-        bbox = draw.textbbox((0, 0), line, font=small_font)
-        line_width = bbox[2] - bbox[0]
-        draw.text(((width - line_width) // 2, y_position), line, fill='black', font=small_font)
-        y_position += 22
+    image = create_label("EAGLE PEAK", "BOURBON WHISKEY", "45% Alc./Vol.", "750 mL", warning_lines)
     
-    # Save
     output_path = 'test_labels/compliance_tests/compliant_warning.png'
-    os.makedirs('test_labels/compliance_tests', exist_ok=True)
     image.save(output_path, 'PNG')
     print(f"✅ Created compliant warning label: {output_path}")
 
@@ -80,43 +79,6 @@ def create_compliant_label():
 def create_lowercase_surgeon_general_label():
     """Non-compliant: 'surgeon general' instead of 'Surgeon General'"""
     
-    width, height = 800, 1000
-    image = Image.new('RGB', (width, height), 'white')
-    draw = ImageDraw.Draw(image)
-    
-    try:
-        title_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 70)
-        medium_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 30)
-        small_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 16)
-    except:
-        title_font = ImageFont.load_default()
-        medium_font = ImageFont.load_default()
-        small_font = ImageFont.load_default()
-    
-    draw.rectangle([(20, 20), (width-20, height-20)], outline='black', width=3)
-    
-    brand_text = "TEST SPIRITS"
-    bbox = draw.textbbox((0, 0), brand_text, font=title_font)
-    brand_width = bbox[2] - bbox[0]
-    draw.text(((width - brand_width) // 2, 80), brand_text, fill='black', font=title_font)
-    
-    draw.line([(60, 180), (width-60, 180)], fill='black', width=2)
-    
-    product_text = "VODKA"
-    bbox = draw.textbbox((0, 0), product_text, font=medium_font)
-    product_width = bbox[2] - bbox[0]
-    draw.text(((width - product_width) // 2, 220), product_text, fill='black', font=medium_font)
-    
-    abv_text = "40% Alc./Vol."
-    bbox = draw.textbbox((0, 0), abv_text, font=medium_font)
-    abv_width = bbox[2] - bbox[0]
-    draw.text(((width - abv_width) // 2, 280), abv_text, fill='black', font=medium_font)
-    
-    net_text = "750 mL"
-    bbox = draw.textbbox((0, 0), net_text, font=medium_font)
-    net_width = bbox[2] - bbox[0]
-    draw.text(((width - net_width) // 2, 340), net_text, fill='black', font=medium_font)
-    
     # NON-COMPLIANT: lowercase "surgeon general"
     warning_lines = [
         "GOVERNMENT WARNING: (1) According to the surgeon general,",  # ❌ lowercase
@@ -126,12 +88,7 @@ def create_lowercase_surgeon_general_label():
         "operate machinery, and may cause health problems."
     ]
     
-    y_position = 450
-    for line in warning_lines:
-        bbox = draw.textbbox((0, 0), line, font=small_font)
-        line_width = bbox[2] - bbox[0]
-        draw.text(((width - line_width) // 2, y_position), line, fill='black', font=small_font)
-        y_position += 22
+    image = create_label("TEST SPIRITS", "VODKA", "40% Alc./Vol.", "750 mL", warning_lines)
     
     output_path = 'test_labels/compliance_tests/noncompliant_lowercase_sg.png'
     image.save(output_path, 'PNG')
@@ -141,43 +98,6 @@ def create_lowercase_surgeon_general_label():
 def create_missing_statement_2_label():
     """Non-compliant: Missing statement (2)"""
     
-    width, height = 800, 1000
-    image = Image.new('RGB', (width, height), 'white')
-    draw = ImageDraw.Draw(image)
-    
-    try:
-        title_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 70)
-        medium_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 30)
-        small_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 16)
-    except:
-        title_font = ImageFont.load_default()
-        medium_font = ImageFont.load_default()
-        small_font = ImageFont.load_default()
-    
-    draw.rectangle([(20, 20), (width-20, height-20)], outline='black', width=3)
-    
-    brand_text = "TEST RUM"
-    bbox = draw.textbbox((0, 0), brand_text, font=title_font)
-    brand_width = bbox[2] - bbox[0]
-    draw.text(((width - brand_width) // 2, 80), brand_text, fill='black', font=title_font)
-    
-    draw.line([(60, 180), (width-60, 180)], fill='black', width=2)
-    
-    product_text = "SPICED RUM"
-    bbox = draw.textbbox((0, 0), product_text, font=medium_font)
-    product_width = bbox[2] - bbox[0]
-    draw.text(((width - product_width) // 2, 220), product_text, fill='black', font=medium_font)
-    
-    abv_text = "35% Alc./Vol."
-    bbox = draw.textbbox((0, 0), abv_text, font=medium_font)
-    abv_width = bbox[2] - bbox[0]
-    draw.text(((width - abv_width) // 2, 280), abv_text, fill='black', font=medium_font)
-    
-    net_text = "700 mL"
-    bbox = draw.textbbox((0, 0), net_text, font=medium_font)
-    net_width = bbox[2] - bbox[0]
-    draw.text(((width - net_width) // 2, 340), net_text, fill='black', font=medium_font)
-    
     # NON-COMPLIANT: Missing statement (2)
     warning_lines = [
         "GOVERNMENT WARNING: (1) According to the Surgeon General,",
@@ -185,12 +105,7 @@ def create_missing_statement_2_label():
         "because of the risk of birth defects.",  # ❌ Missing statement (2)
     ]
     
-    y_position = 450
-    for line in warning_lines:
-        bbox = draw.textbbox((0, 0), line, font=small_font)
-        line_width = bbox[2] - bbox[0]
-        draw.text(((width - line_width) // 2, y_position), line, fill='black', font=small_font)
-        y_position += 22
+    image = create_label("TEST RUM", "SPICED RUM", "35% Alc./Vol.", "700 mL", warning_lines)
     
     output_path = 'test_labels/compliance_tests/noncompliant_missing_statement2.png'
     image.save(output_path, 'PNG')
@@ -198,6 +113,8 @@ def create_missing_statement_2_label():
 
 
 if __name__ == '__main__':
+    # Create compliance tests directory (here, so importing the module has no side effects)
+    os.makedirs('test_labels/compliance_tests', exist_ok=True)
     print("Creating detailed compliance test labels...\n")
     create_compliant_label()
     create_lowercase_surgeon_general_label()
@@ -2,53 +2,69 @@
 Create failure test images for testing mismatch detection
 These images are intentionally wrong to test verification logic
 """
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
+from _fontcache import load_font
+from functools import lru_cache
 import textwrap
 import os
 
 # Create failures directory
 os.makedirs('test_labels/failures', exist_ok=True)
 
+# Government warning wrapped once at import (the text never changes)
+WARNING_TEXT = "GOVERNMENT WARNING: According to the Surgeon General, women should not drink alcoholic beverages during pregnancy because of the risk of birth defects. Consumption of alcoholic beverages impairs your ability to drive a car or operate machinery, and may cause health problems."
+WARNING_LINES = textwrap.wrap(WARNING_TEXT, width=70)
+
 def get_fonts():
     """Try to load system fonts, fallback to default"""
-    try:
-        title_font = ImageFont.truetype('/System/Library/Fonts/Helvetica.ttc', 70)
-        large_font = ImageFont.truetype('/System/Library/Fonts/Helvetica.ttc', 50)
-        medium_font = ImageFont.truetype('/System/Library/Fonts/Helvetica.ttc', 30)
-        warning_font = ImageFont.truetype('/System/Library/Fonts/Helvetica.ttc', 18)
-        return title_font, large_font, medium_font, warning_font
-    except:
-        default = ImageFont.load_default()
-        return default, default, default, default
+    title_font = load_font('/System/Library/Fonts/Helvetica.ttc', 70)
+    large_font = load_font('/System/Library/Fonts/Helvetica.ttc', 50)
+    medium_font = load_font('/System/Library/Fonts/Helvetica.ttc', 30)
+    warning_font = load_font('/System/Library/Fonts/Helvetica.ttc', 18)
+    return title_font, large_font, medium_font, warning_font
 
 
 def add_government_warning(draw, y_position, width, warning_font):
     """Add government warning text"""
-    warning_text = "GOVERNMENT WARNING: According to the Surgeon General, women should not drink alcoholic beverages during pregnancy because of the risk of birth defects. Consumption of alcoholic beverages impairs your ability to drive a car or operate machinery, and may cause health problems."
-    
-    lines = textwrap.wrap(warning_text, width=70)
-    for i, line in enumerate(lines):
+    for i, line in enumerate(WARNING_LINES):
         draw.text((width//2, y_position + i*25), line, fill='black', font=warning_font, anchor='mm')
 
 
-def create_wrong_alcohol_content():
-    """Label with WRONG alcohol percentage"""
+@lru_cache(maxsize=None)
+def base_label(with_warning=True):
+    """Blank 800x1200 label with border, divider and (optionally) the warning; copy before drawing"""
     img = Image.new('RGB', (800, 1200), color='white')
     draw = ImageDraw.Draw(img)
-    title_font, large_font, medium_font, warning_font = get_fonts()
+    warning_font = get_fonts()[3]
     
     draw.rectangle([(10, 10), (790, 1190)], outline='black', width=5)
-    draw.text((400, 80), 'WRONG PROOF DISTILLERY', fill='black', font=title_font, anchor='mm')
     draw.line([(50, 140), (750, 140)], fill='black', width=2)
-    draw.text((400, 220), 'KENTUCKY STRAIGHT', fill='black', font=medium_font, anchor='mm')
-    draw.text((400, 280), 'BOURBON WHISKEY', fill='black', font=large_font, anchor='mm')
-    draw.text((400, 380), 'Aged 4 Years', fill='black', font=medium_font, anchor='mm')
+    if with_warning:
+        add_government_warning(draw, 650, 800, warning_font)
+    return img
+
+
+def render_label(brand, category, product_type, abv, volume, age=None, with_warning=True):
+    """Draw the standard failure-label layout; returns the image so callers can add extras"""
+    img = base_label(with_warning).copy()
+    draw = ImageDraw.Draw(img)
+    title_font, large_font, medium_font, warning_font = get_fonts()
     
+    draw.text((400, 80), brand, fill='black', font=title_font, anchor='mm')
+    draw.text((400, 220), category, fill='black', font=medium_font, anchor='mm')
+    draw.text((400, 280), product_type, fill='black', font=large_font, anchor='mm')
+    if age:
+        draw.text((400, 380), age, fill='black', font=medium_font, anchor='mm')
+    draw.text((400, 460), abv, fill='black', font=large_font, anchor='mm')
+    draw.text((400, 540), volume, fill='black', font=large_font, anchor='mm')
+    return img
+
+
+def create_wrong_alcohol_content():
+    """Label with WRONG alcohol percentage"""
     # WRONG: Label shows 40% but form will say 45%
-    draw.text((400, 460), '40% Alc./Vol. (80 Proof)', fill='black', font=large_font, anchor='mm')
-    draw.text((400, 540), '750 mL', fill='black', font=large_font, anchor='mm')
-    
-    add_government_warning(draw, 650, 800, warning_font)
+    img = render_label('WRONG PROOF DISTILLERY', 'KENTUCKY STRAIGHT', 'BOURBON WHISKEY',
+                       '40% Alc./Vol. (80 Proof)', '750 mL', age='Aged 4 Years')
     
     img.save('test_labels/failures/wrong_alcohol_content.png')
     print("✓ Created: wrong_alcohol_content.png")
@@ -58,21 +74,8 @@ def create_wrong_alcohol_content():
 
 def create_wrong_volume():
     """Label with WRONG net contents"""
-    img = Image.new('RGB', (800, 1200), color='white')
-    draw = ImageDraw.Draw(img)
-    title_font, large_font, medium_font, warning_font = get_fonts()
-    
-    draw.rectangle([(10, 10), (790, 1190)], outline='black', width=5)
-    draw.text((400, 80), 'WRONG SIZE BREWERY', fill='black', font=title_font, anchor='mm')
-    draw.line([(50, 140), (750, 140)], fill='black', width=2)
-    draw.text((400, 220), 'CRAFT', fill='black', font=medium_font, anchor='mm')
-    draw.text((400, 280), 'PALE ALE', fill='black', font=large_font, anchor='mm')
-    draw.text((400, 460), '5.5% Alc./Vol.', fill='black', font=large_font, anchor='mm')
-    
     # WRONG: Label shows 355 mL but form will say 750
-    draw.text((400, 540), '355 mL', fill='black', font=large_font, anchor='mm')
-    
-    add_government_warning(draw, 650, 800, warning_font)
+    img = render_label('WRONG SIZE BREWERY', 'CRAFT', 'PALE ALE', '5.5% Alc./Vol.', '355 mL')
     
     img.save('test_labels/failures/wrong_volume.png')
     print("✓ Created: wrong_volume.png")
@@ -82,22 +85,9 @@ def create_wrong_volume():
 
 def create_wrong_brand():
     """Label with DIFFERENT brand name"""
-    img = Image.new('RGB', (800, 1200), color='white')
-    draw = ImageDraw.Draw(img)
-    title_font, large_font, medium_font, warning_font = get_fonts()
-    
-    draw.rectangle([(10, 10), (790, 1190)], outline='black', width=5)
-    
     # Label says "SUNSET DISTILLERY" but form will say "Eagle Peak"
-    draw.text((400, 80), 'SUNSET DISTILLERY', fill='black', font=title_font, anchor='mm')
-    draw.line([(50, 140), (750, 140)], fill='black', width=2)
-    draw.text((400, 220), 'KENTUCKY STRAIGHT', fill='black', font=medium_font, anchor='mm')
-    draw.text((400, 280), 'BOURBON WHISKEY', fill='black', font=large_font, anchor='mm')
-    draw.text((400, 380), 'Aged 8 Years', fill='black', font=medium_font, anchor='mm')
-    draw.text((400, 460), '45% Alc./Vol. (90 Proof)', fill='black', font=large_font, anchor='mm')
-    draw.text((400, 540), '750 mL', fill='black', font=large_font, anchor='mm')
-    
-    add_government_warning(draw, 650, 800, warning_font)
+    img = render_label('SUNSET DISTILLERY', 'KENTUCKY STRAIGHT', 'BOURBON WHISKEY',
+                       '45% Alc./Vol. (90 Proof)', '750 mL', age='Aged 8 Years')
     
     img.save('test_labels/failures/wrong_brand.png')
     print("✓ Created: wrong_brand.png")
@@ -107,22 +97,9 @@ def create_wrong_brand():
 
 def create_wrong_product_type():
     """Label with WRONG product class"""
-    img = Image.new('RGB', (800, 1200), color='white')
-    draw = ImageDraw.Draw(img)
-    title_font, large_font, medium_font, warning_font = get_fonts()
-    
-    draw.rectangle([(10, 10), (790, 1190)], outline='black', width=5)
-    draw.text((400, 80), 'MOUNTAIN SPIRITS', fill='black', font=title_font, anchor='mm')
-    draw.line([(50, 140), (750, 140)], fill='black', width=2)
-    
     # WRONG: Label says "RYE WHISKEY" but form will say "Bourbon Whiskey"
-    draw.text((400, 220), 'STRAIGHT', fill='black', font=medium_font, anchor='mm')
-    draw.text((400, 280), 'RYE WHISKEY', fill='black', font=large_font, anchor='mm')
-    draw.text((400, 380), 'Aged 4 Years', fill='black', font=medium_font, anchor='mm')
-    draw.text((400, 460), '45% Alc./Vol. (90 Proof)', fill='black', font=large_font, anchor='mm')
-    draw.text((400, 540), '750 mL', fill='black', font=large_font, anchor='mm')
-    
-    add_government_warning(draw, 650, 800, warning_font)
+    img = render_label('MOUNTAIN SPIRITS', 'STRAIGHT', 'RYE WHISKEY',
+                       '45% Alc./Vol. (90 Proof)', '750 mL', age='Aged 4 Years')
     
     img.save('test_labels/failures/wrong_product_type.png')
     print("✓ Created: wrong_product_type.png")
@@ -132,20 +109,12 @@ def create_wrong_product_type():
 
 def create_missing_government_warning():
     """Label WITHOUT government warning"""
-    img = Image.new('RGB', (800, 1200), color='white')
-    draw = ImageDraw.Draw(img)
-    title_font, large_font, medium_font, warning_font = get_fonts()
-    
-    draw.rectangle([(10, 10), (790, 1190)], outline='black', width=5)
-    draw.text((400, 80), 'ILLEGAL BREWERY', fill='black', font=title_font, anchor='mm')
-    draw.line([(50, 140), (750, 140)], fill='black', width=2)
-    draw.text((400, 220), 'CRAFT', fill='black', font=medium_font, anchor='mm')
-    draw.text((400, 280), 'PALE ALE', fill='black', font=large_font, anchor='mm')
-    draw.text((400, 460), '6.0% Alc./Vol.', fill='black', font=large_font, anchor='mm')
-    draw.text((400, 540), '355 mL', fill='black', font=large_font, anchor='mm')
+    img = render_label('ILLEGAL BREWERY', 'CRAFT', 'PALE ALE', '6.0% Alc./Vol.', '355 mL',
+                       with_warning=False)
     
     # NO GOVERNMENT WARNING!
-    draw.text((400, 750), 'Enjoy Responsibly', fill='gray', font=warning_font, anchor='mm')
+    draw = ImageDraw.Draw(img)
+    draw.text((400, 750), 'Enjoy Responsibly', fill='gray', font=get_fonts()[3], anchor='mm')
     
     img.save('test_labels/failures/missing_warning.png')
     print("✓ Created: missing_warning.png")
@@ -155,27 +124,10 @@ def create_missing_government_warning():
 
 def create_multiple_errors():
     """Label with MULTIPLE errors"""
-    img = Image.new('RGB', (800, 1200), color='white')
-    draw = ImageDraw.Draw(img)
-    title_font, large_font, medium_font, warning_font = get_fonts()
-    
-    draw.rectangle([(10, 10), (790, 1190)], outline='black', width=5)
-    
-    # Wrong brand (should be "Eagle Peak")
-    draw.text((400, 80), 'FAKE DISTILLERY', fill='black', font=title_font, anchor='mm')
-    draw.line([(50, 140), (750, 140)], fill='black', width=2)
-    draw.text((400, 220), 'KENTUCKY STRAIGHT', fill='black', font=medium_font, anchor='mm')
-    
-    # Wrong type (should be "Bourbon Whiskey")
-    draw.text((400, 280), 'VODKA', fill='black', font=large_font, anchor='mm')
-    
-    # Wrong alcohol (should be 45%)
-    draw.text((400, 460), '35% Alc./Vol.', fill='black', font=large_font, anchor='mm')
-    
-    # Wrong volume (should be 750)
-    draw.text((400, 540), '1000 mL', fill='black', font=large_font, anchor='mm')
-    
-    # No warning
+    # Wrong brand (should be "Eagle Peak"), type (should be "Bourbon Whiskey"),
+    # alcohol (should be 45%) and volume (should be 750); no warning
+    img = render_label('FAKE DISTILLERY', 'KENTUCKY STRAIGHT', 'VODKA', '35% Alc./Vol.', '1000 mL',
+                       with_warning=False)
     
     img.save('test_labels/failures/multiple_errors.png')
     print("✓ Created: multiple_errors.png")
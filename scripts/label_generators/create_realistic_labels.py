@@ -2,32 +2,27 @@
 Create realistic-looking label images with proper text rendering
 These should work better with OCR while still testing quality scenarios
 """
-from PIL import Image, ImageDraw, ImageFont, ImageFilter
+from PIL import Image, ImageDraw, ImageFilter
+from _fontcache import load_font
 import textwrap
 
+# Government warning wrapped once at import (the text never changes)
+WARNING_TEXT = "GOVERNMENT WARNING: According to the Surgeon General, women should not drink alcoholic beverages during pregnancy because of the risk of birth defects. Consumption of alcoholic beverages impairs your ability to drive a car or operate machinery, and may cause health problems."
+WARNING_LINES = textwrap.wrap(WARNING_TEXT, width=60)
+
 def get_fonts():
     """Try to load system fonts, fallback to default"""
-    try:
-        title_font = ImageFont.truetype('/System/Library/Fonts/Supplemental/Arial Bold.ttf', 60)
-        large_font = ImageFont.truetype('/System/Library/Fonts/Supplemental/Arial Bold.ttf', 45)
-        medium_font = ImageFont.truetype('/System/Library/Fonts/Supplemental/Arial.ttf', 35)
-        small_font = ImageFont.truetype('/System/Library/Fonts/Supplemental/Arial.ttf', 25)
-        warning_font = ImageFont.truetype('/System/Library/Fonts/Supplemental/Arial.ttf', 16)
-        return title_font, large_font, medium_font, small_font, warning_font
-    except:
-        default = ImageFont.load_default()
-        return default, default, default, default, default
+    title_font = load_font('/System/Library/Fonts/Supplemental/Arial Bold.ttf', 60)
+    large_font = load_font('/System/Library/Fonts/Supplemental/Arial Bold.ttf', 45)
+    medium_font = load_font('/System/Library/Fonts/Supplemental/Arial.ttf', 35)
+    small_font = load_font('/System/Library/Fonts/Supplemental/Arial.ttf', 25)
+    warning_font = load_font('/System/Library/Fonts/Supplemental/Arial.ttf', 16)
+    return title_font, large_font, medium_font, small_font, warning_font
 
 
 def add_government_warning(draw, y_position, width, warning_font):
     """Add government warning text"""
-    warning_text = "GOVERNMENT WARNING: According to the Surgeon General, women should not drink alcoholic beverages during pregnancy because of the risk of birth defects. Consumption of alcoholic beverages impairs your ability to drive a car or operate machinery, and may cause health problems."
-    
-    # Wrap text
-    max_width = width - 100
-    lines = textwrap.wrap(warning_text, width=60)
-    
-    for i, line in enumerate(lines):
+    for i, line in enumerate(WARNING_LINES):
         draw.text((width//2, y_position + i*20), line, fill='black', font=warning_font, anchor='mm')
 
 
@@ -124,12 +119,8 @@ def create_tiny_resolution_label():
     img = Image.new('RGB', (300, 400), color='#F0E68C')  # Fails minimum!
     draw = ImageDraw.Draw(img)
     
-    try:
-        tiny_title = ImageFont.truetype('/System/Library/Fonts/Supplemental/Arial Bold.ttf', 20)
-        tiny_text = ImageFont.truetype('/System/Library/Fonts/Supplemental/Arial.ttf', 14)
-    except:
-        tiny_title = ImageFont.load_default()
-        tiny_text = ImageFont.load_default()
+    tiny_title = load_font('/System/Library/Fonts/Supplemental/Arial Bold.ttf', 20)
+    tiny_text = load_font('/System/Library/Fonts/Supplemental/Arial.ttf', 14)
     
     # Header
     draw.rectangle([(0, 0), (300, 60)], fill='#8B4513')
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """Regenerate old test labels with compliant government warnings."""
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
+from _fontcache import load_font
+from functools import lru_cache
 import os
 
 # Full compliant government warning per 27 CFR 16.21
@@ -12,6 +14,32 @@ during pregnancy because of the risk of birth defects.
 ability to drive a car or operate machinery, and may
 cause health problems."""
 
+# Spacing between warning lines
+WARNING_LINE_HEIGHT = 22
+
+
+def get_fonts():
+    """Try to load system fonts, fallback to default"""
+    title_font = load_font("/System/Library/Fonts/Helvetica.ttc", 60)
+    product_font = load_font("/System/Library/Fonts/Helvetica.ttc", 40)
+    info_font = load_font("/System/Library/Fonts/Helvetica.ttc", 30)
+    warning_font = load_font("/System/Library/Fonts/Helvetica.ttc", 16)
+    return title_font, product_font, info_font, warning_font
+
+
+@lru_cache(maxsize=None)
+def warning_block(width):
+    """Government warning rendered once onto white, for pasting below the label text"""
+    lines = COMPLIANT_WARNING.split('\n')
+    block = Image.new('RGB', (width, (len(lines) + 1) * WARNING_LINE_HEIGHT), color='white')
+    draw = ImageDraw.Draw(block)
+    warning_font = get_fonts()[3]
+    
+    for i, line in enumerate(lines):
+        draw.text((0, i * WARNING_LINE_HEIGHT), line, font=warning_font, fill='black')
+    return block
+
+
 def create_label_with_warning(
     filename,
     brand_name,
@@ -30,16 +58,7 @@ def create_label_with_warning(
     img = Image.new('RGB', (width, height), color='white')
     draw = ImageDraw.Draw(img)
     
-    try:
-        title_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 60)
-        product_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 40)
-        info_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 30)
-        warning_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 16)
-    except:
-        title_font = ImageFont.load_default()
-        product_font = ImageFont.load_default()
-        info_font = ImageFont.load_default()
-        warning_font = ImageFont.load_default()
+    title_font, product_font, info_font, warning_font = get_fonts()
     
     y_position = 50
     
@@ -67,108 +86,107 @@ def create_label_with_warning(
     # Add some spacing before warning
     y_position += 30
     
-    # Government warning - wrapped text
-    warning_lines = COMPLIANT_WARNING.split('\n')
-    for line in warning_lines:
-        draw.text((50, y_position), line, font=warning_font, fill='black')
-        y_position += 22
+    # Government warning - wrapped text (rendered once, pasted per label)
+    img.paste(warning_block(width - 50), (50, y_position))
     
     # Save image
     os.makedirs(os.path.dirname(filename), exist_ok=True)
     img.save(filename)
     print(f"✓ Created: {filename}")
 
-# Regenerate all non-compliant labels
-print("Regenerating old test labels with compliant government warnings...")
-print("=" * 80)
-
-# Main test labels
-create_label_with_warning(
-    "test_labels/clear_bourbon.png",
-    "Crystal Clear",
-    "Bourbon Whiskey",
-    "45",
-    "750"
-)
-
-create_label_with_warning(
-    "test_labels/low_contrast_vodka.png",
-    "Smooth Spirit",
-    "Premium Vodka",
-    "40",
-    "750"
-)
-
-create_label_with_warning(
-    "test_labels/test_ocr.png",
-    "OCR Test",
-    "Bourbon Whiskey",
-    "43",
-    "750"
-)
-
-# Failure test labels
-create_label_with_warning(
-    "test_labels/failures/wrong_alcohol_content.png",
-    "Mountain Peak",
-    "Bourbon Whiskey",
-    "50",  # Different from expected
-    "750"
-)
-
-create_label_with_warning(
-    "test_labels/failures/wrong_brand.png",
-    "Wrong Brand Name",
-    "Bourbon Whiskey",
-    "45",
-    "750"
-)
-
-create_label_with_warning(
-    "test_labels/failures/wrong_product_type.png",
-    "Mountain Peak",
-    "Rye Whiskey",  # Different product type
-    "45",
-    "750"
-)
-
-create_label_with_warning(
-    "test_labels/failures/wrong_volume.png",
-    "Mountain Peak",
-    "Bourbon Whiskey",
-    "45",
-    "700"  # Different volume
-)
-
-# OCR tolerance test
-create_label_with_warning(
-    "test_labels/ocr_tolerance_tests/error_tolerance_test.png",
-    "Mountaln Peak",  # Intentional OCR error: "i" looks like "l"
-    "Bourbon Whiskey",
-    "45",
-    "750"
-)
-
-# Product type specific labels
-create_label_with_warning(
-    "test_labels/product_types/beer_label.png",
-    "Craft Brewery",
-    "IPA",
-    "6.5",
-    "355",
-    "INGREDIENTS: Water, Malted Barley, Hops, Yeast",
-    "Beer"
-)
-
-create_label_with_warning(
-    "test_labels/product_types/wine_label.png",
-    "Vineyard Estate",
-    "Cabernet Sauvignon",
-    "13.5",
-    "750",
-    "CONTAINS SULFITES",
-    "Wine"
-)
-
-print("=" * 80)
-print("✅ All labels regenerated with compliant government warnings!")
+
+if __name__ == "__main__":
+    # Regenerate all non-compliant labels
+    print("Regenerating old test labels with compliant government warnings...")
+    print("=" * 80)
+
+    # Main test labels
+    create_label_with_warning(
+        "test_labels/clear_bourbon.png",
+        "Crystal Clear",
+        "Bourbon Whiskey",
+        "45",
+        "750"
+    )
+
+    create_label_with_warning(
+        "test_labels/low_contrast_vodka.png",
+        "Smooth Spirit",
+        "Premium Vodka",
+        "40",
+        "750"
+    )
+
+    create_label_with_warning(
+        "test_labels/test_ocr.png",
+        "OCR Test",
+        "Bourbon Whiskey",
+        "43",
+        "750"
+    )
+
+    # Failure test labels
+    create_label_with_warning(
+        "test_labels/failures/wrong_alcohol_content.png",
+        "Mountain Peak",
+        "Bourbon Whiskey",
+        "50",  # Different from expected
+        "750"
+    )
+
+    create_label_with_warning(
+        "test_labels/failures/wrong_brand.png",
+        "Wrong Brand Name",
+        "Bourbon Whiskey",
+        "45",
+        "750"
+    )
+
+    create_label_with_warning(
+        "test_labels/failures/wrong_product_type.png",
+        "Mountain Peak",
+        "Rye Whiskey",  # Different product type
+        "45",
+        "750"
+    )
+
+    create_label_with_warning(
+        "test_labels/failures/wrong_volume.png",
+        "Mountain Peak",
+        "Bourbon Whiskey",
+        "45",
+        "700"  # Different volume
+    )
+
+    # OCR tolerance test
+    create_label_with_warning(
+        "test_labels/ocr_tolerance_tests/error_tolerance_test.png",
+        "Mountaln Peak",  # Intentional OCR error: "i" looks like "l"
+        "Bourbon Whiskey",
+        "45",
+        "750"
+    )
+
+    # Product type specific labels
+    create_label_with_warning(
+        "test_labels/product_types/beer_label.png",
+        "Craft Brewery",
+        "IPA",
+        "6.5",
+        "355",
+        "INGREDIENTS: Water, Malted Barley, Hops, Yeast",
+        "Beer"
+    )
+
+    create_label_with_warning(
+        "test_labels/product_types/wine_label.png",
+        "Vineyard Estate",
+        "Cabernet Sauvignon",
+        "13.5",
+        "750",
+        "CONTAINS SULFITES",
+        "Wine"
+    )
+
+    print("=" * 80)
+    print("✅ All labels regenerated with compliant government warnings!")